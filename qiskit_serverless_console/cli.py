@@ -3,12 +3,15 @@
 from __future__ import annotations
 
 from .config import parse_options
-from .watch import run_watch
 
 
 def main() -> int:
     """CLI main entrypoint."""
     options = parse_options()
+    # Imported after argument parsing so `--help` and usage errors skip the
+    # qiskit/textual import cost.
+    from .watch import run_watch  # pylint: disable=import-outside-toplevel
+
     return run_watch(options)
 
 
@@ -4,10 +4,15 @@ from __future__ import annotations
 
 import argparse
 import os
+from concurrent.futures import Future
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
-from qiskit_ibm_runtime import QiskitRuntimeService
-from qiskit_serverless import ServerlessClient
+from .executor import DaemonThreadPoolExecutor
+
+if TYPE_CHECKING:
+    from qiskit_ibm_runtime import QiskitRuntimeService
+    from qiskit_serverless import ServerlessClient
 
 ENV_GATEWAY_PROVIDER_HOST = "ENV_GATEWAY_PROVIDER_HOST"
 ENV_GATEWAY_PROVIDER_TOKEN = "ENV_GATEWAY_PROVIDER_TOKEN"
@@ -33,6 +38,9 @@ class WatchOptions:
     interval: int
     json_mode: bool
     no_color: bool
+    adaptive: bool = False
+    max_interval: int = 30
+    dedupe: bool = False
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -64,6 +72,22 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Disable ANSI colors in terminal output.",
     )
+    parser.add_argument(
+        "--adaptive",
+        action="store_true",
+        help="With --json, poll less often while no job status changes.",
+    )
+    parser.add_argument(
+        "--max-interval",
+        type=int,
+        default=30,
+        help="Upper bound in seconds for the --adaptive polling interval.",
+    )
+    parser.add_argument(
+        "--dedupe",
+        action="store_true",
+        help="With --json, replace unchanged snapshots with a periodic heartbeat.",
+    )
     return parser
 
 
@@ -86,27 +110,77 @@ def parse_options() -> WatchOptions:
         interval=max(1, args.interval),
         json_mode=bool(args.json),
         no_color=bool(args.no_color),
+        adaptive=bool(args.adaptive),
+        max_interval=max(1, args.interval, args.max_interval),
+        dedupe=bool(args.dedupe),
     )
 
 
-def build_clients() -> tuple[ServerlessClient, QiskitRuntimeService]:
-    """Construct API clients from environment variables."""
-    instance = os.getenv(ENV_QISKIT_IBM_INSTANCE)
+def _build_serverless_client(
+    client_class: type[ServerlessClient],
+) -> ServerlessClient:
     ibm_token = os.getenv(ENV_QISKIT_IBM_TOKEN)
-    gateway_host = os.getenv(ENV_GATEWAY_PROVIDER_HOST, DEFAULT_GATEWAY_HOST)
-    gateway_token = os.getenv(ENV_GATEWAY_PROVIDER_TOKEN, ibm_token)
-
-    serverless_client = ServerlessClient(
-        host=gateway_host,
-        token=gateway_token,
-        instance=instance,
+    return client_class(
+        host=os.getenv(ENV_GATEWAY_PROVIDER_HOST, DEFAULT_GATEWAY_HOST),
+        token=os.getenv(ENV_GATEWAY_PROVIDER_TOKEN, ibm_token),
+        instance=os.getenv(ENV_QISKIT_IBM_INSTANCE),
         channel=DEFAULT_CHANNEL,
     )
 
-    runtime_service = QiskitRuntimeService(
+
+def _build_runtime_service(
+    service_class: type[QiskitRuntimeService],
+) -> QiskitRuntimeService:
+    return service_class(
         channel=os.getenv(ENV_QISKIT_IBM_CHANNEL, DEFAULT_CHANNEL),
-        token=ibm_token,
-        instance=instance,
+        token=os.getenv(ENV_QISKIT_IBM_TOKEN),
+        instance=os.getenv(ENV_QISKIT_IBM_INSTANCE),
         url=os.getenv(ENV_QISKIT_IBM_URL, DEFAULT_RUNTIME_URL),
     )
-    return serverless_client, runtime_service
+
+
+class ClientBundle:
+    """API clients constructed concurrently in background threads.
+
+    Both constructors start when the bundle is created; ``serverless`` and
+    ``runtime`` each wait only for their own client.
+    """
+
+    def __init__(self) -> None:
+        # Imported on the calling thread: qiskit_serverless imports
+        # qiskit_ibm_runtime itself, and importing that package tree from two
+        # threads at once can hit partially initialized modules.
+        # pylint: disable=import-outside-toplevel,redefined-outer-name
+        from qiskit_ibm_runtime import QiskitRuntimeService
+        from qiskit_serverless import ServerlessClient
+
+        # Daemon workers, so a hung authentication call cannot block exit
+        executor = DaemonThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="client-init"
+        )
+        self._serverless: Future[ServerlessClient] = executor.submit(
+            _build_serverless_client, ServerlessClient
+        )
+        self._runtime: Future[QiskitRuntimeService] = executor.submit(
+            _build_runtime_service, QiskitRuntimeService
+        )
+        executor.shutdown(wait=False)
+
+    @property
+    def serverless(self) -> ServerlessClient:
+        """Serverless gateway client."""
+        return self._serverless.result()
+
+    @property
+    def runtime(self) -> QiskitRuntimeService:
+        """Qiskit Runtime service."""
+        return self._runtime.result()
+
+
+def build_clients() -> ClientBundle:
+    """Construct API clients from environment variables.
+
+    Construction starts immediately in the background; the returned bundle
+    hands out each client once it is ready.
+    """
+    return ClientBundle()
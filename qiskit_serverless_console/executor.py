@@ -0,0 +1,92 @@
+"""Thread pool for blocking I/O that never holds up interpreter exit."""
+
+from __future__ import annotations
+
+from concurrent.futures import Executor, Future
+from queue import Empty, SimpleQueue
+from threading import Lock, Semaphore, Thread
+from typing import Any, Callable, Tuple
+
+_WorkItem = Tuple["Future[Any]", Callable[..., Any], Tuple[Any, ...], "dict[str, Any]"]
+
+
+class DaemonThreadPoolExecutor(Executor):
+    """``ThreadPoolExecutor`` look-alike whose workers are daemon threads.
+
+    ``ThreadPoolExecutor`` joins its workers at interpreter exit, so a single
+    hung HTTP call keeps the process alive after quit or Ctrl+C. Calls still
+    running here are abandoned at exit instead.
+    """
+
+    def __init__(self, max_workers: int, thread_name_prefix: str = "") -> None:
+        if max_workers <= 0:
+            raise ValueError("max_workers must be greater than 0")
+        self._max_workers = max_workers
+        self._thread_name_prefix = thread_name_prefix or "daemon-pool"
+        self._work_queue: SimpleQueue[_WorkItem | None] = SimpleQueue()
+        # Released by a worker each time it goes back to waiting for work
+        self._idle_semaphore = Semaphore(0)
+        self._threads: list[Thread] = []
+        self._shutdown = False
+        self._lock = Lock()
+
+    def submit(  # pylint: disable=arguments-differ
+        self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any
+    ) -> Future[Any]:
+        """Schedule ``fn(*args, **kwargs)`` and return its future."""
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new futures after shutdown")
+            future: Future[Any] = Future()
+            self._work_queue.put((future, fn, args, kwargs))
+            self._adjust_thread_count()
+            return future
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        """Stop accepting work; optionally cancel queued calls and join workers."""
+        with self._lock:
+            self._shutdown = True
+            if cancel_futures:
+                while True:
+                    try:
+                        item = self._work_queue.get_nowait()
+                    except Empty:
+                        break
+                    if item is not None:
+                        item[0].cancel()
+            # One sentinel is enough: each worker puts it back for the next one
+            self._work_queue.put(None)
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+    def _adjust_thread_count(self) -> None:
+        # Reuse an idle worker if there is one
+        if self._idle_semaphore.acquire(timeout=0):
+            return
+        if len(self._threads) < self._max_workers:
+            thread = Thread(
+                target=self._worker,
+                name=f"{self._thread_name_prefix}_{len(self._threads)}",
+                daemon=True,
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def _worker(self) -> None:
+        while True:
+            item = self._work_queue.get()
+            if item is None:
+                self._work_queue.put(None)
+                return
+            future, fn, args, kwargs = item
+            if future.set_running_or_notify_cancel():
+                try:
+                    result = fn(*args, **kwargs)
+                except BaseException as error:  # pylint: disable=broad-exception-caught
+                    future.set_exception(error)
+                else:
+                    future.set_result(result)
+            # Drop references before idling so results can be collected
+            del item, future, fn, args, kwargs
+            self._idle_semaphore.release()
@@ -2,43 +2,40 @@
 
 from __future__ import annotations
 
-from typing import Any
-
-from qiskit_serverless import ServerlessClient
+from typing import TYPE_CHECKING, Any
 
+from .executor import DaemonThreadPoolExecutor
 from .status import map_serverless_status
 
+if TYPE_CHECKING:
+    from qiskit_serverless import ServerlessClient
+
+MAX_STATUS_QUERY_WORKERS = 8
+
 
 def _provider_name_from(
     data: dict[str, Any], program_data: dict[str, Any]
 ) -> str | None:
-    provider_data = program_data.get("provider")
-    if isinstance(provider_data, dict):
-        name = provider_data.get("name")
-        if name:
-            return str(name)
-    elif provider_data:
-        return str(provider_data)
-
-    top_level_provider = data.get("provider")
-    if isinstance(top_level_provider, dict):
-        name = top_level_provider.get("name")
-        if name:
-            return str(name)
-    elif top_level_provider:
-        return str(top_level_provider)
+    # The program's provider wins over the top-level one.
+    for provider_data in (program_data.get("provider"), data.get("provider")):
+        if isinstance(provider_data, dict):
+            name = provider_data.get("name")
+            if name:
+                return str(name)
+        elif provider_data:
+            return str(provider_data)
     return None
 
 
 def _display_function_name(data: dict[str, Any]) -> str | None:
     program_data = data.get("program") or {}
     function_name = program_data.get("title")
+    if not function_name:
+        return None
     provider_name = _provider_name_from(data, program_data)
-    if function_name and provider_name:
+    if provider_name:
         return f"{provider_name}/{function_name}"
-    if function_name:
-        return str(function_name)
-    return None
+    return str(function_name)
 
 
 def fetch_serverless_rows(
@@ -52,39 +49,47 @@ def fetch_serverless_rows(
 
     def _to_summary_rows(jobs: list[Any]) -> list[dict[str, Any]]:
         out: list[dict[str, Any]] = []
+        append = out.append
         for job in jobs:
             data = job.raw_data or {}
-            status = str(data.get("status", "Unknown"))
-            sub_status = data.get("sub_status")
-            out.append(
+            get = data.get
+            sub_status = get("sub_status")
+            append(
                 {
-                    "job_id": data.get("id", job.job_id),
-                    "status": map_serverless_status(status, sub_status),
+                    "job_id": get("id", job.job_id),
+                    "status": map_serverless_status(
+                        str(get("status", "Unknown")), sub_status
+                    ),
                     "sub_status": sub_status,
-                    "created": data.get("created"),
+                    "created": get("created"),
                     "function": _display_function_name(data),
                 }
             )
         return out
 
-    if not statuses:
+    def _params(status: str | None) -> dict[str, Any]:
         params: dict[str, Any] = {"limit": limit, "offset": offset}
+        if status is not None:
+            params["status"] = status
         if created_after_iso:
             params["created_after"] = created_after_iso
-        jobs = client.jobs(**params)
-        return _to_summary_rows(jobs)
+        return params
 
-    rows: list[dict[str, Any]] = []
-    seen: set[str] = set()
-    for status in statuses:
-        params: dict[str, Any] = {"limit": limit, "offset": offset, "status": status}
-        if created_after_iso:
-            params["created_after"] = created_after_iso
-        jobs = client.jobs(**params)
+    if not statuses:
+        return _to_summary_rows(client.jobs(**_params(None)))
+
+    # One request per status filter; they are independent so run them together.
+    # Daemon workers, so a hung request cannot block process exit.
+    with DaemonThreadPoolExecutor(
+        max_workers=min(MAX_STATUS_QUERY_WORKERS, len(statuses))
+    ) as executor:
+        results = list(
+            executor.map(lambda status: client.jobs(**_params(status)), statuses)
+        )
+
+    # A job can match several status filters; keep its first occurrence.
+    rows_by_job_id: dict[str, dict[str, Any]] = {}
+    for jobs in results:
         for row in _to_summary_rows(jobs):
-            job_id = str(row.get("job_id"))
-            if job_id in seen:
-                continue
-            seen.add(job_id)
-            rows.append(row)
-    return rows
+            rows_by_job_id.setdefault(str(row.get("job_id")), row)
+    return list(rows_by_job_id.values())
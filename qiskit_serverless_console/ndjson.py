@@ -0,0 +1,88 @@
+"""Newline-delimited JSON output helpers."""
+
+from __future__ import annotations
+
+import json
+import sys
+from queue import Empty, Full, Queue
+from threading import Thread
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional speedup, see the `fast` extra
+    orjson = None
+
+# Records waiting for the writer thread before the oldest one is dropped
+WRITER_QUEUE_SIZE = 4
+
+# Reused by the stdlib fallback; json.dumps() with options builds a new one per call.
+_ENCODER = json.JSONEncoder(default=str, separators=(",", ":"))
+
+
+def dumps(payload: Any) -> bytes:
+    """Serialize one NDJSON record, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(payload, default=str)
+    return _ENCODER.encode(payload).encode("utf-8")
+
+
+def write_record(record: bytes) -> None:
+    """Write one NDJSON line to stdout with a single write and flush."""
+    stdout = sys.stdout
+    binary = getattr(stdout, "buffer", None)
+    if binary is None:
+        stdout.write(record.decode("utf-8") + "\n")
+        stdout.flush()
+        return
+    stdout.flush()  # Keep ordering with anything already printed as text.
+    # Buffered together and flushed once, without copying the record.
+    binary.writelines((record, b"\n"))
+    binary.flush()
+
+
+class RecordWriter:
+    """Write NDJSON records to stdout from a background thread.
+
+    A slow stdout reader then never blocks the caller. Each record is a full
+    snapshot, so when the queue is full the oldest pending one is dropped.
+    """
+
+    def __init__(self, maxsize: int = WRITER_QUEUE_SIZE) -> None:
+        self._queue: Queue[bytes | None] = Queue(maxsize=maxsize)
+        self._error: OSError | None = None
+        self._thread = Thread(target=self._run, name="ndjson-writer", daemon=True)
+        self._thread.start()
+
+    def put(self, record: bytes) -> None:
+        """Queue a record; re-raises a write error from a previous record."""
+        if self._error is not None:
+            raise self._error
+        while True:
+            try:
+                self._queue.put_nowait(record)
+                return
+            except Full:
+                try:
+                    self._queue.get_nowait()
+                except Empty:
+                    pass
+
+    def close(self, timeout: float = 2.0) -> None:
+        """Write the pending records and stop the thread."""
+        try:
+            self._queue.put(None, timeout=timeout)
+        except Full:
+            return
+        self._thread.join(timeout=timeout)
+
+    def _run(self) -> None:
+        while True:
+            record = self._queue.get()
+            if record is None:
+                return
+            try:
+                write_record(record)
+            except OSError as error:  # e.g. the reader closed the pipe
+                self._error = error
+                return
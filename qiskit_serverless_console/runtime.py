@@ -2,20 +2,44 @@
 
 from __future__ import annotations
 
+import math
 import time
 from collections import deque
 from threading import Event, Lock, Thread
-from typing import Any
-
-from qiskit_ibm_runtime import QiskitRuntimeService
+from typing import TYPE_CHECKING, Any, Callable
 
+from .executor import DaemonThreadPoolExecutor
 from .status import runtime_is_terminal
 
-DISCOVERY_BATCH_SIZE = 3
+if TYPE_CHECKING:
+    from qiskit_ibm_runtime import QiskitRuntimeService
+
+DISCOVERY_BATCH_SIZE = 8
 WORKER_TICK_SECONDS = 0.2
 REDISCOVERY_INTERVAL_SECONDS = (
     5.0  # Re-discover runtime jobs for active serverless jobs
 )
+# Minimum seconds between status polls of a runtime job still waiting to run.
+WAITING_STATUS_TTL_SECONDS = 5.0
+# Slack when comparing against a TTL, so a job due at this tick is not missed
+# by float rounding and left for the next refresh cycle.
+TTL_TOLERANCE_SECONDS = WORKER_TICK_SECONDS / 2
+_WAITING_RUNTIME_STATUSES = frozenset({"QUEUED", "PENDING", "INITIALIZING"})
+RUNTIME_IO_WORKERS = 16
+# Status refresh backs off to this multiple of its recent average duration.
+REFRESH_COST_FACTOR = 2.0
+REFRESH_DURATION_WINDOW = 5
+
+_DISCOVERY_PENDING = 0
+_DISCOVERY_IN_FLIGHT = 1
+_DISCOVERY_DONE = 2
+
+# Shared pool for runtime discovery and status requests; these are I/O bound
+# HTTP round-trips with no shared state until results are merged. Daemon
+# workers, so a hung request never blocks process exit.
+_IO_EXECUTOR = DaemonThreadPoolExecutor(
+    max_workers=RUNTIME_IO_WORKERS, thread_name_prefix="runtime-io"
+)
 
 
 class RuntimeState:
@@ -26,6 +50,7 @@ class RuntimeState:
         runtime_service: QiskitRuntimeService,
         serverless_client: Any,
         interval: int,
+        on_change: Callable[[], None] | None = None,
     ):
         self._runtime_service = runtime_service
         self._serverless_client = serverless_client
@@ -36,16 +61,25 @@ class RuntimeState:
         self.serverless_runtime_index: dict[str, list[str]] = {}
         self.runtime_cache: dict[str, dict[str, Any]] = {}
         self._discovery_queue: deque[str] = deque()
-        self._discovery_pending: set[str] = set()
-        self._discovery_done: set[str] = set()
+        # Discovery state per serverless job; absent means never queued.
+        self._discovery: dict[str, int] = {}
         # Track which serverless jobs need continuous status refresh (non-terminal)
         self._active_serverless_jobs: set[str] = set()
-        # Track terminal jobs that user expanded (on-demand status fetch trigger)
-        self._expanded_terminal_jobs: set[str] = set()
         # Terminal jobs present on initial load: discover runtime IDs only, no status polling
         self._frozen_terminal_jobs: set[str] = set()
         # Track last rediscovery time for active jobs
         self._last_rediscovery_at: float = 0.0
+        # Bumped only when discovered ids or runtime status/backend change
+        self._revision = 0
+        # Called from the worker thread after an iteration that changed data
+        self._on_change = on_change
+        # Durations of the latest status refreshes (sliding window)
+        self._refresh_durations: deque[float] = deque(maxlen=REFRESH_DURATION_WINDOW)
+
+    @property
+    def revision(self) -> int:
+        """Counter bumped when a runtime status, backend or discovered id changes."""
+        return self._revision
 
     @property
     def runtime_service(self) -> QiskitRuntimeService:
@@ -73,18 +107,25 @@ class RuntimeState:
             is_terminal: If False, these jobs will have continuous status refresh.
                          If True, status refresh only happens when explicitly requested.
         """
-        for job_id in serverless_job_ids:
-            normalized_job_id = str(job_id)
-            with self._lock:
+        normalized_job_ids = [str(job_id) for job_id in serverless_job_ids]
+        with self._lock:
+            for normalized_job_id in normalized_job_ids:
                 self.serverless_runtime_index.setdefault(normalized_job_id, [])
-                if not is_terminal:
-                    self._active_serverless_jobs.add(normalized_job_id)
-                if (
-                    normalized_job_id not in self._discovery_done
-                    and normalized_job_id not in self._discovery_pending
-                ):
+                if normalized_job_id not in self._discovery:
                     self._discovery_queue.append(normalized_job_id)
-                    self._discovery_pending.add(normalized_job_id)
+                    self._discovery[normalized_job_id] = _DISCOVERY_PENDING
+            if not is_terminal:
+                self._active_serverless_jobs.update(normalized_job_ids)
+
+    def forget_runtime_discovery(self, serverless_job_ids: list[str]) -> None:
+        """Stop periodic rediscovery for serverless jobs no longer listed.
+
+        Cached runtime data is kept; enqueueing the job again resumes refresh.
+        """
+        with self._lock:
+            self._active_serverless_jobs.difference_update(
+                str(job_id) for job_id in serverless_job_ids
+            )
 
     def mark_job_terminal(self, serverless_job_id: str) -> None:
         """Mark a serverless job as terminal (stop continuous refresh)."""
@@ -102,77 +143,96 @@ class RuntimeState:
                 ):
                     if runtime_id in self.runtime_cache:
                         self.runtime_cache[runtime_id]["poll_enabled"] = True
-            self._expanded_terminal_jobs.add(serverless_job_id)
+            # Expiring the TTL forces one status fetch on the next refresh.
+            for runtime_id in self.serverless_runtime_index.get(serverless_job_id, []):
+                if runtime_id in self.runtime_cache:
+                    self.runtime_cache[runtime_id]["ttl"] = 0.0
 
     def freeze_terminal_jobs(self, serverless_job_ids: list[str]) -> None:
         """Freeze initial terminal jobs: keep discovery, skip runtime status refresh."""
+        normalized_job_ids = [str(job_id) for job_id in serverless_job_ids]
         with self._lock:
-            for job_id in serverless_job_ids:
-                self._frozen_terminal_jobs.add(str(job_id))
+            self._frozen_terminal_jobs.update(normalized_job_ids)
 
     def is_discovery_done(self, serverless_job_id: str) -> bool:
         """Check if runtime discovery has completed for a serverless job."""
         with self._lock:
-            return serverless_job_id in self._discovery_done
+            return self._discovery.get(serverless_job_id) == _DISCOVERY_DONE
 
     def get_runtime_count(self, serverless_job_id: str) -> int | None:
         """Get runtime job count, or None if discovery not done yet."""
         with self._lock:
-            if serverless_job_id not in self._discovery_done:
+            if self._discovery.get(serverless_job_id) != _DISCOVERY_DONE:
                 return None
             return len(self.serverless_runtime_index.get(serverless_job_id, []))
 
     def attach_runtime_rows(self, rows: list[dict[str, Any]]) -> None:
         """Merge cached runtime status into output rows."""
+        job_ids = [str(row.get("job_id")) for row in rows]
+        # Copy out only what the rows need; output rows are built unlocked.
         with self._lock:
-            for row in rows:
-                job_id = str(row.get("job_id"))
-                runtime_ids = list(self.serverless_runtime_index.get(job_id, []))
-                row["runtime_jobs"] = [
+            index = self.serverless_runtime_index
+            runtime_ids_by_job = {
+                job_id: tuple(index.get(job_id, ())) for job_id in job_ids
+            }
+            cache = self.runtime_cache
+            runtime_snapshot = {
+                runtime_id: (
+                    cache[runtime_id].get("backend", "(unknown)"),
+                    cache[runtime_id].get("status", ""),
+                )
+                for runtime_ids in runtime_ids_by_job.values()
+                for runtime_id in runtime_ids
+                if runtime_id in cache
+            }
+
+        missing = ("(unknown)", "")
+        for row, job_id in zip(rows, job_ids):
+            runtime_jobs = []
+            for runtime_id in runtime_ids_by_job[job_id]:
+                backend, status = runtime_snapshot.get(runtime_id, missing)
+                runtime_jobs.append(
                     {
                         "runtime_job_id": runtime_id,
-                        "backend": self.runtime_cache.get(runtime_id, {}).get(
-                            "backend", "(unknown)"
-                        ),
-                        "status": self.runtime_cache.get(runtime_id, {}).get(
-                            "status", ""
-                        ),
+                        "backend": backend,
+                        "status": status,
                     }
-                    for runtime_id in runtime_ids
-                ]
+                )
+            row["runtime_jobs"] = runtime_jobs
 
     def _requeue_active_for_rediscovery(self) -> None:
         """Re-enqueue active serverless jobs for runtime rediscovery."""
         with self._lock:
             for job_id in self._active_serverless_jobs:
-                if job_id in self._discovery_done:
-                    self._discovery_done.discard(job_id)
-                if job_id not in self._discovery_pending:
+                # Pending jobs are already queued and in-flight ones are being
+                # discovered right now.
+                if self._discovery.get(job_id, _DISCOVERY_DONE) == _DISCOVERY_DONE:
                     self._discovery_queue.append(job_id)
-                    self._discovery_pending.add(job_id)
+                    self._discovery[job_id] = _DISCOVERY_PENDING
 
     def _discover_batch(self) -> None:
         batch: list[str] = []
         with self._lock:
             while self._discovery_queue and len(batch) < DISCOVERY_BATCH_SIZE:
                 job_id = self._discovery_queue.popleft()
-                self._discovery_pending.discard(job_id)
+                self._discovery[job_id] = _DISCOVERY_IN_FLIGHT
                 batch.append(job_id)
 
-        for job_id in batch:
-            try:
-                discovered_runtime_ids = self._serverless_client.runtime_jobs(job_id)
-            except Exception:  # pylint: disable=broad-exception-caught
-                discovered_runtime_ids = []
+        if not batch:
+            return
+        discovered = self._bulk_runtime_jobs(batch)
 
-            with self._lock:
+        changed = False
+        with self._lock:
+            for job_id, discovered_runtime_ids in discovered.items():
                 runtime_ids_for_job = self.serverless_runtime_index.setdefault(
                     job_id, []
                 )
-                for runtime_id in discovered_runtime_ids or []:
+                for runtime_id in discovered_runtime_ids:
                     normalized_runtime_id = str(runtime_id)
                     if normalized_runtime_id not in runtime_ids_for_job:
                         runtime_ids_for_job.append(normalized_runtime_id)
+                        changed = True
                     if normalized_runtime_id not in self.runtime_cache:
                         poll_enabled = job_id not in self._frozen_terminal_jobs
                         self.runtime_cache[normalized_runtime_id] = {
@@ -180,92 +240,125 @@ class RuntimeState:
                             "backend": "(unknown)",
                             "terminal": False,
                             "poll_enabled": poll_enabled,
+                            "last_refreshed": 0.0,
+                            "ttl": 0.0,
                         }
                     elif job_id in self._frozen_terminal_jobs:
                         self.runtime_cache[normalized_runtime_id][
                             "poll_enabled"
                         ] = False
-                self._discovery_done.add(job_id)
+                self._discovery[job_id] = _DISCOVERY_DONE
+            # A rediscovery that finds no new runtime jobs changes nothing
+            if changed:
+                self._revision += 1
 
-    def _refresh_runtime_statuses(self) -> None:
+    def _bulk_runtime_jobs(self, job_ids: list[str]) -> dict[str, list[str]]:
+        """Discover runtime job IDs for several serverless jobs concurrently.
+
+        The gateway only exposes runtime jobs per serverless job, so requests are
+        fanned out over the shared I/O pool instead of a single bulk query.
+        """
+
+        def _runtime_jobs(job_id: str) -> list[str]:
+            try:
+                return list(self._serverless_client.runtime_jobs(job_id) or [])
+            except Exception:  # pylint: disable=broad-exception-caught
+                return []
+
+        return dict(zip(job_ids, _IO_EXECUTOR.map(_runtime_jobs, job_ids)))
+
+    def _status_ttl(self, status: str) -> float:
+        """Seconds before a runtime job with this status is polled again."""
+        if runtime_is_terminal(status):
+            return math.inf
+        if status.upper() in _WAITING_RUNTIME_STATUSES:
+            return max(WAITING_STATUS_TTL_SECONDS, self._interval * 3.0)
+        return float(self._interval)
+
+    def _refresh_runtime_statuses(self, now: float) -> None:
+        """Poll the runtime jobs whose TTL has expired at ``now``.
+
+        ``now`` is the worker's scheduled tick time rather than the current
+        time, so time spent on discovery earlier in the tick does not push a
+        job polled every interval past its next due time.
+        """
         with self._lock:
-            # Collect runtime IDs from active (non-terminal) serverless jobs
-            active_runtime_ids: set[str] = set()
-            for job_id in self._active_serverless_jobs:
-                for runtime_id in self.serverless_runtime_index.get(job_id, []):
-                    runtime_data = self.runtime_cache.get(runtime_id, {})
-                    if not runtime_data.get("terminal", False) and runtime_data.get(
-                        "poll_enabled", True
-                    ):
-                        active_runtime_ids.add(runtime_id)
-
-            # Continue refreshing any non-terminal runtime even if its parent became terminal
-            non_terminal_runtime_ids: set[str] = set()
-            for runtime_id, runtime_data in self.runtime_cache.items():
-                if not runtime_data.get("terminal", False) and runtime_data.get(
-                    "poll_enabled", True
+            entries = list(self.runtime_cache.items())
+        # Terminal runtimes have an infinite TTL and are never polled again;
+        # frozen runtimes are skipped until the user expands their job.
+        due_at = now + TTL_TOLERANCE_SECONDS
+        runtime_ids = [
+            runtime_id
+            for runtime_id, runtime_data in entries
+            if runtime_data.get("poll_enabled", True)
+            and due_at - runtime_data.get("last_refreshed", 0.0)
+            >= runtime_data.get("ttl", 0.0)
+        ]
+
+        if not runtime_ids:
+            return
+        results = list(_IO_EXECUTOR.map(self._fetch_one_runtime, runtime_ids))
+
+        changed = False
+        with self._lock:
+            for runtime_id, status, backend, error in results:
+                runtime_data = self.runtime_cache[runtime_id]
+                runtime_data["last_refreshed"] = now
+                if error is not None:
+                    status = f"UNAVAILABLE: {error}"
+                    backend = runtime_data.get("backend", "(unknown)")
+                    runtime_data["ttl"] = float(self._interval)
+                else:
+                    runtime_data["terminal"] = runtime_is_terminal(status)
+                    runtime_data["ttl"] = self._status_ttl(status)
+                # A poll that returns what is already cached changes nothing
+                if (
+                    runtime_data.get("status") != status
+                    or runtime_data.get("backend") != backend
                 ):
-                    non_terminal_runtime_ids.add(runtime_id)
-
-            # Collect runtime IDs from terminal jobs that user expanded
-            expanded_runtime_ids: set[str] = set()
-            expanded_jobs_to_process = set(self._expanded_terminal_jobs)
-            for job_id in expanded_jobs_to_process:
-                for runtime_id in self.serverless_runtime_index.get(job_id, []):
-                    # Only fetch if we don't have status yet
-                    runtime_data = self.runtime_cache.get(runtime_id, {})
-                    if runtime_data.get("poll_enabled", True) and not runtime_data.get(
-                        "status"
-                    ):
-                        expanded_runtime_ids.add(runtime_id)
-            # Clear expanded jobs after collecting (one-time fetch)
-            self._expanded_terminal_jobs.clear()
-
-            runtime_ids = list(
-                active_runtime_ids | non_terminal_runtime_ids | expanded_runtime_ids
+                    runtime_data["status"] = status
+                    runtime_data["backend"] = backend
+                    changed = True
+            if changed:
+                self._revision += 1
+
+    def _fetch_one_runtime(
+        self, runtime_id: str
+    ) -> tuple[str, str | None, str | None, Exception | None]:
+        """Fetch status and backend for one runtime job without touching shared state."""
+        try:
+            runtime_job = self._runtime_service.job(runtime_id)
+            status_value = runtime_job.status()
+            status = (
+                str(status_value.value)
+                if hasattr(status_value, "value")
+                else str(status_value)
             )
 
-        for runtime_id in runtime_ids:
-            try:
-                runtime_job = self._runtime_service.job(runtime_id)
-                status_value = runtime_job.status()
-                status = (
-                    str(status_value.value)
-                    if hasattr(status_value, "value")
-                    else str(status_value)
-                )
-
-                runtime_backend = getattr(runtime_job, "backend", None)
-                if callable(runtime_backend):
-                    runtime_backend = runtime_backend()
-                backend_name = getattr(runtime_backend, "name", None)
-                backend = (
-                    str(backend_name)
-                    if backend_name
-                    else str(runtime_backend or "(unknown)")
-                )
+            runtime_backend = getattr(runtime_job, "backend", None)
+            if callable(runtime_backend):
+                runtime_backend = runtime_backend()
+            backend_name = getattr(runtime_backend, "name", None)
+            backend = (
+                str(backend_name)
+                if backend_name
+                else str(runtime_backend or "(unknown)")
+            )
+            return runtime_id, status, backend, None
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            return runtime_id, None, None, error
 
-                with self._lock:
-                    self.runtime_cache[runtime_id]["status"] = status
-                    self.runtime_cache[runtime_id]["backend"] = backend
-                    self.runtime_cache[runtime_id]["terminal"] = runtime_is_terminal(
-                        status
-                    )
-            except Exception as error:  # pylint: disable=broad-exception-caught
-                with self._lock:
-                    self.runtime_cache[runtime_id]["status"] = f"UNAVAILABLE: {error}"
-                    self.runtime_cache[runtime_id]["backend"] = self.runtime_cache[
-                        runtime_id
-                    ].get(
-                        "backend",
-                        "(unknown)",
-                    )
+    def _next_refresh_delay(self) -> float:
+        """Refresh interval, stretched when recent refreshes have been slow."""
+        average = sum(self._refresh_durations) / len(self._refresh_durations)
+        return max(float(self._interval), REFRESH_COST_FACTOR * average)
 
     def _refresh_worker(self) -> None:
         next_status_refresh_at = 0.0
         next_rediscovery_at = 0.0
         while not self._stop_event.is_set():
             now = time.monotonic()
+            revision = self._revision
 
             # Periodically re-queue active jobs for runtime rediscovery
             if now >= next_rediscovery_at:
@@ -275,7 +368,13 @@ class RuntimeState:
             self._discover_batch()
 
             if now >= next_status_refresh_at:
-                self._refresh_runtime_statuses()
-                next_status_refresh_at = now + self._interval
+                started_at = time.monotonic()
+                self._refresh_runtime_statuses(now)
+                self._refresh_durations.append(time.monotonic() - started_at)
+                next_status_refresh_at = now + self._next_refresh_delay()
+
+            # One notification per iteration, however many entries changed
+            if self._on_change is not None and self._revision != revision:
+                self._on_change()
 
             self._stop_event.wait(WORKER_TICK_SECONDS)
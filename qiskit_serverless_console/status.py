@@ -17,22 +17,54 @@ ANSI_COLORS = {
 }
 
 
+_STATUS_COLORS: dict[str, str] = {
+    "RUNNING": "yellow",
+    "DONE": "green",
+    "SUCCEEDED": "green",
+    "ERROR": "red",
+    "FAILED": "red",
+    "CANCELED": "magenta",
+    "CANCELLED": "magenta",
+    "STOPPED": "magenta",
+    "QUEUED": "cyan",
+    "INITIALIZING": "blue",
+    "PENDING": "blue",
+}
+
+# Statuses with a dedicated color; anything else resolves through status_color.
+KNOWN_STATUSES = frozenset(_STATUS_COLORS)
+
+# Display statuses (serverless and runtime) after which a job no longer changes.
+TERMINAL_STATUSES = frozenset(
+    {"DONE", "SUCCEEDED", "ERROR", "FAILED", "CANCELED", "CANCELLED", "STOPPED"}
+)
+_RUNTIME_TERMINAL_STATUSES = frozenset(
+    {"DONE", "ERROR", "CANCELED", "CANCELLED", "FAILED"}
+)
+
+
+def is_terminal_status(status: object) -> bool:
+    """Return whether a display status (serverless or runtime) is terminal."""
+    # Statuses normally arrive already canonical; only normalize the others.
+    if status.__class__ is str and status in KNOWN_STATUSES:
+        return status in TERMINAL_STATUSES
+    return str(status or "").strip().upper() in TERMINAL_STATUSES
+
+
+def _normalize(status: object) -> str:
+    if isinstance(status, str):
+        return status.upper()
+    return str(status or "").upper()
+
+
 def status_color(status: str) -> str:
     """Resolve status color by semantic group."""
-    normalized = str(status or "").upper()
-    if normalized.startswith("RUNNING"):
-        return "yellow"
-    if normalized in ("DONE", "SUCCEEDED"):
-        return "green"
-    if normalized in ("ERROR", "FAILED"):
-        return "red"
-    if normalized in ("CANCELED", "CANCELLED", "STOPPED"):
-        return "magenta"
-    if normalized == "QUEUED":
-        return "cyan"
-    if normalized in ("INITIALIZING", "PENDING"):
-        return "blue"
-    return "gray"
+    normalized = _normalize(status)
+    color = _STATUS_COLORS.get(normalized)
+    if color is not None:
+        return color
+    # Sub-statuses such as "RUNNING: OPTIMIZING_HARDWARE" share the running color.
+    return "yellow" if normalized.startswith("RUNNING") else "gray"
 
 
 def colorize(text: str, color: str, enabled: bool) -> str:
@@ -44,8 +76,7 @@ def colorize(text: str, color: str, enabled: bool) -> str:
 
 def runtime_is_terminal(status: str) -> bool:
     """Return whether a runtime status is terminal."""
-    normalized = str(status or "").upper()
-    return normalized in ("DONE", "ERROR", "CANCELED", "CANCELLED", "FAILED")
+    return _normalize(status) in _RUNTIME_TERMINAL_STATUSES
 
 
 def map_serverless_status(status: str, sub_status: str | None) -> str:
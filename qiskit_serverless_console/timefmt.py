@@ -3,22 +3,44 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any
 
 
-def relative_created(value: Any) -> str:
-    """Render an ISO timestamp as relative age."""
+@lru_cache(maxsize=2048)
+def _parse_iso(raw: str) -> datetime:
+    """Parse an ISO timestamp once; naive values are assumed to be UTC."""
+    created_dt = datetime.fromisoformat(raw.replace("Z", "+00:00"))
+    if created_dt.tzinfo is None:
+        created_dt = created_dt.replace(tzinfo=timezone.utc)
+    return created_dt
+
+
+def created_timestamp(value: Any) -> float:
+    """Return an ISO timestamp as epoch seconds, or ``0.0`` if missing/invalid."""
+    raw = str(value or "").strip()
+    if not raw:
+        return 0.0
+    try:
+        return _parse_iso(raw).timestamp()
+    except ValueError:
+        return 0.0
+
+
+def relative_created(value: Any, now: datetime | None = None) -> str:
+    """Render an ISO timestamp as relative age.
+
+    Pass the same ``now`` for every row of a refresh so all rows cross age
+    buckets together.
+    """
     raw = str(value or "").strip()
     if not raw:
         return "-"
     try:
-        normalized = raw.replace("Z", "+00:00")
-        created_dt = datetime.fromisoformat(normalized)
-        if created_dt.tzinfo is None:
-            created_dt = created_dt.replace(tzinfo=timezone.utc)
-        delta_seconds = max(
-            0, int((datetime.now(timezone.utc) - created_dt).total_seconds())
-        )
+        created_dt = _parse_iso(raw)
+        if now is None:
+            now = datetime.now(timezone.utc)
+        delta_seconds = max(0, int((now - created_dt).total_seconds()))
         if delta_seconds < 60:
             return f"{delta_seconds}s ago"
         if delta_seconds < 3600:
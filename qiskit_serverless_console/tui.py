@@ -2,43 +2,55 @@
 
 from __future__ import annotations
 
-import threading
+import asyncio
 import time
-from typing import Any
+from concurrent.futures import Executor
+from datetime import datetime, timezone
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, TypeVar
 
 from rich.spinner import Spinner
 from rich.table import Table
 from rich.text import Text
 from textual.app import App, ComposeResult
+from textual.message import Message
 from textual.screen import ModalScreen
 from textual.widgets import Button, Footer, Header, Static, Tree
 from textual.containers import Horizontal, Vertical, VerticalScroll
 
 from .config import WatchOptions, build_clients
+from .executor import DaemonThreadPoolExecutor
 from .fetch import fetch_serverless_rows
 from .runtime import RuntimeState
-from .status import status_color
-from .timefmt import relative_created
+from .status import KNOWN_STATUSES, is_terminal_status, status_color
+from .timefmt import created_timestamp, relative_created
 
 # Unicode braille spinner frames for tree labels (Tree doesn't support Rich Spinner)
-_SPINNER_FRAMES = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
+_SPINNER_FRAMES = ("⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏")
+_SPINNER_FRAME_COUNT = len(_SPINNER_FRAMES)
+# Spinner animation runs on its own fast interval; data polling/diffing is slower.
+SPINNER_TICK_SECONDS = 0.1
+DATA_TICK_SECONDS = 0.5
+# Bursts of runtime updates are coalesced into one redraw after this delay.
+RUNTIME_RENDER_DEBOUNCE_SECONDS = 0.05
+# Shared stand-in for nodes without data (the tree root); read-only.
+_NO_NODE_DATA: Mapping[str, str] = MappingProxyType({})
+# Threads for blocking fetch/logs/stop calls made from the UI
+UI_IO_WORKERS = 4
 
+_T = TypeVar("_T")
 
-def _field_or_blank(value: Any) -> str:
-    return str(value or "").strip()
 
+async def _run_blocking(
+    executor: Executor | None, func: Callable[..., _T], *args: Any
+) -> _T:
+    """Await a blocking call on ``executor`` (the loop's default if None)."""
+    return await asyncio.get_running_loop().run_in_executor(executor, func, *args)
 
-def _is_terminal_status(value: Any) -> bool:
-    normalized = _field_or_blank(value).upper()
-    return normalized in (
-        "DONE",
-        "SUCCEEDED",
-        "ERROR",
-        "FAILED",
-        "CANCELED",
-        "CANCELLED",
-        "STOPPED",
-    )
+
+def _field_or_blank(value: Any) -> str:
+    return str(value or "").strip()
 
 
 def _combined_status(status: Any, sub_status: Any) -> str:
@@ -47,15 +59,27 @@ def _combined_status(status: Any, sub_status: Any) -> str:
     return f"{base} / {detail}" if detail else base
 
 
+# status_color names that Rich spells differently
+_RICH_COLOR_NAMES = {"white_bright": "bright_white", "gray": "bright_black"}
+
+
+def _resolve_status_style(status_text: str) -> str:
+    color = status_color(status_text)
+    return _RICH_COLOR_NAMES.get(color, color)
+
+
+# Known statuses resolved once at import; anything else (such as a status with
+# a sub-status) is resolved on demand. Labels are cached, so that stays rare.
+_STYLE_LUT: dict[str, str] = {
+    status: _resolve_status_style(status) for status in KNOWN_STATUSES
+}
+
+
 def _status_style(status_text: str, no_color: bool) -> str | None:
     if no_color:
         return None
-    color = status_color(status_text)
-    if color == "white_bright":
-        return "bright_white"
-    if color == "gray":
-        return "bright_black"
-    return color
+    style = _STYLE_LUT.get(status_text)
+    return style if style is not None else _resolve_status_style(status_text)
 
 
 class LogsScreen(ModalScreen[None]):
@@ -82,41 +106,78 @@ class LogsScreen(ModalScreen[None]):
     }
     """
 
-    def __init__(self, job_id: str) -> None:
+    def __init__(
+        self,
+        job_id: str,
+        serverless_client: Any,
+        executor: Executor | None = None,
+    ) -> None:
         super().__init__()
         self._job_id = job_id
+        self._serverless_client = serverless_client
+        self._executor = executor
         self._loading = True
+        self._spinner_frame = 0
+        # Markup is fixed per modal; only the spinner frame varies.
+        self._header = f"[bold]Logs for job: {job_id}[/bold]\n{'─' * 60}\n\n"
+        self._loading_messages = tuple(
+            f"{self._header}{spinner_char} Loading logs..."
+            for spinner_char in _SPINNER_FRAMES
+        )
+
+    # Widget looked up once in on_mount, for the spinner animation
+    _content: Static
 
     def compose(self) -> ComposeResult:
         with VerticalScroll(id="logs-container"):
             yield Static(
-                f"[bold]Logs for job: {self._job_id}[/bold]\n{'─' * 60}\n\n⠋ Loading logs...",
+                self._loading_messages[0],
                 id="logs-content",
                 markup=True,
             )
         yield Footer()
 
     def on_mount(self) -> None:
-        """Start spinner animation."""
+        """Start spinner animation and fetch the logs."""
+        self._content = self.query_one("#logs-content", Static)
         self._update_loading()
         self.set_interval(0.1, self._update_loading)
+        # Started only now, so the result always finds the mounted widgets
+        self.run_worker(self._fetch_logs(), group="logs")
 
     def _update_loading(self) -> None:
         """Update the loading spinner."""
         if not self._loading:
             return
-        content = self.query_one("#logs-content", Static)
-        spinner_char = _SPINNER_FRAMES[int(time.monotonic() * 10) % len(_SPINNER_FRAMES)]
-        content.update(
-            f"[bold]Logs for job: {self._job_id}[/bold]\n{'─' * 60}\n\n{spinner_char} Loading logs..."
-        )
+        self._content.update(self._loading_messages[self._spinner_frame])
+        self._spinner_frame = (self._spinner_frame + 1) % _SPINNER_FRAME_COUNT
+
+    async def _fetch_logs(self) -> None:
+        """Fetch logs from the API without blocking the event loop."""
+        try:
+            logs = await _run_blocking(self._executor, self._read_logs)
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            logs = f"Error fetching logs: {error}"
+        try:
+            self.set_logs(logs)
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            # e.g. logs that are not valid markup; report it in the modal
+            # instead of failing the worker (and with it the app).
+            self._loading = False
+            self.query_one("#logs-content", Static).update(
+                Text(f"Error showing logs: {error}", style="red")
+            )
+
+    def _read_logs(self) -> str:
+        """Blocking logs call; runs in a worker thread."""
+        job = self._serverless_client.job(self._job_id)
+        return job.logs()
 
     def set_logs(self, logs: str) -> None:
         """Update the screen with the fetched logs."""
         self._loading = False
         content = self.query_one("#logs-content", Static)
-        header = f"[bold]Logs for job: {self._job_id}[/bold]\n{'─' * 60}\n\n"
-        content.update(header + (logs or "(empty)"))
+        content.update(self._header + (logs or "(empty)"))
 
     def check_action(self, action: str, parameters: tuple[object, ...]) -> bool | None:
         """Block dismiss action while loading."""
@@ -164,20 +225,32 @@ class StopConfirmScreen(ModalScreen[None]):
         job_type: str,
         serverless_client: Any | None = None,
         runtime_service: Any | None = None,
+        executor: Executor | None = None,
     ) -> None:
         super().__init__()
         self._job_id = job_id
         self._job_type = job_type  # "serverless" or "runtime"
         self._serverless_client = serverless_client
         self._runtime_service = runtime_service
+        self._executor = executor
         self._confirming = True
         self._stopping = False
+        self._spinner_frame = 0
+        self._job_type_label = "runtime job" if job_type == "runtime" else "job"
+        # Markup is fixed per modal; only the spinner frame varies.
+        self._stopping_messages = tuple(
+            f"[bold]{spinner_char} Stopping {self._job_type_label}...[/bold]\n\n"
+            f"[bright_white]{job_id}[/bright_white]"
+            for spinner_char in _SPINNER_FRAMES
+        )
+
+    # Widget looked up once in on_mount, for the spinner animation
+    _message: Static
 
     def compose(self) -> ComposeResult:
-        job_type_label = "runtime job" if self._job_type == "runtime" else "job"
         with Vertical(id="stop-container"):
             yield Static(
-                f"[bold]Stop {job_type_label}?[/bold]\n\n"
+                f"[bold]Stop {self._job_type_label}?[/bold]\n\n"
                 f"[bright_white]{self._job_id}[/bright_white]",
                 id="stop-message",
                 markup=True,
@@ -188,6 +261,7 @@ class StopConfirmScreen(ModalScreen[None]):
 
     def on_mount(self) -> None:
         """Focus the Ok button by default."""
+        self._message = self.query_one("#stop-message", Static)
         self.query_one("#ok-btn", Button).focus()
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
@@ -201,45 +275,45 @@ class StopConfirmScreen(ModalScreen[None]):
         """Start the stop operation."""
         self._confirming = False
         self._stopping = True
-        message = self.query_one("#stop-message", Static)
-        spinner_char = _SPINNER_FRAMES[0]
-        job_type_label = "runtime job" if self._job_type == "runtime" else "job"
-        message.update(
-            f"[bold]{spinner_char} Stopping {job_type_label}...[/bold]\n\n"
-            f"[bright_white]{self._job_id}[/bright_white]"
-        )
+        self._message.update(self._stopping_messages[0])
         self.query_one("#ok-btn", Button).disabled = True
         self.query_one("#cancel-btn", Button).disabled = True
         self.set_interval(0.1, self._update_stopping)
-        thread = threading.Thread(target=self._perform_stop, daemon=True)
-        thread.start()
+        self.run_worker(self._perform_stop(), group="stop")
 
     def _update_stopping(self) -> None:
         """Update spinner during stop operation."""
         if not self._stopping:
             return
-        message = self.query_one("#stop-message", Static)
-        spinner_char = _SPINNER_FRAMES[int(time.monotonic() * 10) % len(_SPINNER_FRAMES)]
-        job_type_label = "runtime job" if self._job_type == "runtime" else "job"
-        message.update(
-            f"[bold]{spinner_char} Stopping {job_type_label}...[/bold]\n\n"
-            f"[bright_white]{self._job_id}[/bright_white]"
-        )
+        self._spinner_frame = (self._spinner_frame + 1) % _SPINNER_FRAME_COUNT
+        self._message.update(self._stopping_messages[self._spinner_frame])
 
-    def _perform_stop(self) -> None:
-        """Perform the stop operation in background thread."""
+    async def _perform_stop(self) -> None:
+        """Perform the stop operation without blocking the event loop."""
+        success, message = True, None
         try:
-            if self._job_type == "runtime" and self._runtime_service is not None:
-                job = self._runtime_service.job(self._job_id)
-                job.cancel()
-            elif self._serverless_client is not None:
-                job = self._serverless_client.job(self._job_id)
-                job.stop()
-            else:
-                raise ValueError("No client available")
-            self.app.call_from_thread(self._set_result, True, None)
+            await _run_blocking(self._executor, self._stop_job)
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            success, message = False, str(error)
+        try:
+            self._set_result(success, message)
         except Exception as error:  # pylint: disable=broad-exception-caught
-            self.app.call_from_thread(self._set_result, False, str(error))
+            # Report it in the modal instead of failing the worker (and the app)
+            self._stopping = False
+            self.query_one("#stop-message", Static).update(
+                Text(f"Error showing stop result: {error}", style="red")
+            )
+
+    def _stop_job(self) -> None:
+        """Blocking stop call; runs in a worker thread."""
+        if self._job_type == "runtime" and self._runtime_service is not None:
+            job = self._runtime_service.job(self._job_id)
+            job.cancel()
+        elif self._serverless_client is not None:
+            job = self._serverless_client.job(self._job_id)
+            job.stop()
+        else:
+            raise ValueError("No client available")
 
     def _set_result(self, success: bool, error: str | None) -> None:
         """Update screen with stop result."""
@@ -318,13 +392,16 @@ class JobsTreeApp(App[int]):
         ("q", "quit", "Q Quit"),
     ]
 
+    # Widgets looked up once in on_mount
+    _tree: Tree[dict[str, str]]
+    _status_widget: Static
+    _pause_overlay: Vertical
+
     def action_tree_cursor_up(self) -> None:
-        tree = self.query_one("#jobs", Tree)
-        tree.action_cursor_up()
+        self._tree.action_cursor_up()
 
     def action_tree_cursor_down(self) -> None:
-        tree = self.query_one("#jobs", Tree)
-        tree.action_cursor_down()
+        self._tree.action_cursor_down()
 
     def action_toggle_pause(self) -> None:
         """Toggle pause state."""
@@ -342,16 +419,15 @@ class JobsTreeApp(App[int]):
         """Enter paused state."""
         self._paused = True
         self.add_class("paused")
-        overlay = self.query_one("#pause-overlay", Vertical)
-        overlay.add_class("visible")
+        self._pause_overlay.add_class("visible")
 
     def _resume(self) -> None:
         """Exit paused state."""
         self._paused = False
         self._last_change_time = time.monotonic()  # Reset auto-pause timer
         self.remove_class("paused")
-        overlay = self.query_one("#pause-overlay", Vertical)
-        overlay.remove_class("visible")
+        self._tree_dirty = True
+        self._pause_overlay.remove_class("visible")
 
     # Auto-pause after 10 minutes of no changes
     AUTO_PAUSE_SECONDS = 10 * 60
@@ -359,8 +435,16 @@ class JobsTreeApp(App[int]):
     def __init__(self, options: WatchOptions) -> None:
         super().__init__()
         self.options = options
+        # Label styles resolved once; no_color disables every style.
+        self._style_bright_white = None if options.no_color else "bright_white"
+        self._style_bright_black = None if options.no_color else "bright_black"
         self._rows: list[dict[str, Any]] = []
+        # Derived from _rows whenever a fetch is applied
+        self._rows_sorted: list[dict[str, Any]] = []
+        self._current_job_ids: set[str] = set()
         self._job_nodes: dict[str, Any] = {}  # job_id -> TreeNode
+        # job_id -> {runtime_job_id -> TreeNode}
+        self._runtime_nodes: dict[str, dict[str, Any]] = {}
         self._job_terminal_status: dict[str, bool] = {}  # job_id -> is_terminal
         self._job_runtime_count: dict[str, int] = {}  # job_id -> runtime count (for auto-expand)
         self._runtime_status: dict[str, str] = {}  # runtime_job_id -> latest status
@@ -370,13 +454,38 @@ class JobsTreeApp(App[int]):
         self._first_fetch = True
         self._last_error: str | None = None
         self._status_text = "Connecting to Qiskit services..."
+        # Last rendered (fetch inflight, has error, text) of the status line
+        self._last_status_sig: tuple[bool, bool, str] | None = None
+        self._status_spinner = Spinner("dots", style="bright_black")
         self._serverless_client: Any | None = None
         self._runtime_state: RuntimeState | None = None
+        # Shared by fetch, logs and stop so UI actions never spawn threads;
+        # daemon workers, so a hung call cannot keep the app from exiting.
+        self._executor = DaemonThreadPoolExecutor(
+            max_workers=UI_IO_WORKERS, thread_name_prefix="tui-io"
+        )
         self._spinner_frame = 0  # For animating tree label spinners
         self._paused = False
         self._last_change_time = time.monotonic()  # Track last change for auto-pause
         self._previous_job_ids: set[str] = set()  # For detecting new jobs
         self._previous_statuses: dict[str, str] = {}  # For detecting status changes
+        # Last built labels keyed by job_id / runtime_job_id. Job entries are
+        # (signature, spinner frame, label without spinner, label); runtime
+        # entries are (signature, label).
+        self._job_label_cache: dict[
+            str, tuple[tuple[Any, ...], int | None, Text, Text]
+        ] = {}
+        self._runtime_label_cache: dict[str, tuple[tuple[Any, ...], Text]] = {}
+        # Relative age text per job_id, computed once per render pass
+        self._created_texts: dict[str, str | None] = {}
+        # Redraw bookkeeping: skip _render_tree when nothing can have changed
+        self._tree_dirty = True
+        # Nodes currently showing a spinner: key -> (node, row or runtime, is_job)
+        self._animating_nodes: dict[str, tuple[Any, dict[str, Any], bool]] = {}
+        self._last_tree_render_at = 0.0
+        self._runtime_revision = -1
+        self._render_scheduled = False
+        self._last_render_fingerprint: tuple[Any, ...] | None = None
 
     def compose(self) -> ComposeResult:
         yield Header(show_clock=True)
@@ -391,69 +500,64 @@ class JobsTreeApp(App[int]):
         yield Footer()
 
     def on_mount(self) -> None:
-        tree = self.query_one("#jobs", Tree)
+        self._tree = tree = self.query_one("#jobs", Tree)
+        self._status_widget = self.query_one("#status", Static)
+        self._pause_overlay = self.query_one("#pause-overlay", Vertical)
         tree.show_root = True
         tree.root.expand()
-        self.set_interval(0.2, self._tick)
+        self.set_interval(SPINNER_TICK_SECONDS, self._animate_spinners)
+        self.set_interval(DATA_TICK_SECONDS, self._tick)
         self._render_status()
         self._render_tree()
 
     def on_tree_node_expanded(self, event: Tree.NodeExpanded[dict[str, str]]) -> None:
         """Request status refresh when user expands a terminal job."""
-        data = event.node.data or {}
+        data = event.node.data or _NO_NODE_DATA
         if data.get("type") == "job" and data.get("job_id"):
             job_id = data["job_id"]
             if self._runtime_state is not None:
                 self._runtime_state.request_status_refresh(job_id)
+            self._tree_dirty = True
 
     def on_unmount(self) -> None:
         if self._runtime_state is not None:
             self._runtime_state.stop()
+        self._executor.shutdown(wait=False, cancel_futures=True)
 
     def action_toggle_selected(self) -> None:
-        tree = self.query_one("#jobs", Tree)
+        tree = self._tree
         node = tree.cursor_node
         if node is not None and node.allow_expand:
             tree.action_toggle_node()
 
     def action_show_logs(self) -> None:
         """Show logs for the selected serverless job."""
-        tree = self.query_one("#jobs", Tree)
-        node = tree.cursor_node
+        node = self._tree.cursor_node
         if node is None:
             return
-        data = node.data or {}
+        data = node.data or _NO_NODE_DATA
         # Get job_id from either a job node or a runtime node (which also has job_id)
         job_id = data.get("job_id")
         if not job_id:
             return
         if self._serverless_client is None:
             return
-        # Show modal immediately with loading spinner
-        logs_screen = LogsScreen(job_id)
-        self.push_screen(logs_screen)
-        # Fetch logs in background thread
-        thread = threading.Thread(
-            target=self._fetch_logs, args=(job_id, logs_screen), daemon=True
+        # Show modal immediately with loading spinner; it fetches the logs
+        # itself once mounted.
+        self.push_screen(
+            LogsScreen(
+                job_id,
+                serverless_client=self._serverless_client,
+                executor=self._executor,
+            )
         )
-        thread.start()
-
-    def _fetch_logs(self, job_id: str, logs_screen: LogsScreen) -> None:
-        """Fetch logs from the API and update the modal."""
-        try:
-            job = self._serverless_client.job(job_id)
-            logs = job.logs()
-        except Exception as error:  # pylint: disable=broad-exception-caught
-            logs = f"Error fetching logs: {error}"
-        self.call_from_thread(logs_screen.set_logs, logs)
 
     def action_stop_job(self) -> None:
         """Show confirmation to stop the selected job (serverless or runtime)."""
-        tree = self.query_one("#jobs", Tree)
-        node = tree.cursor_node
+        node = self._tree.cursor_node
         if node is None:
             return
-        data = node.data or {}
+        data = node.data or _NO_NODE_DATA
         node_type = data.get("type")
 
         if node_type == "job":
@@ -468,6 +572,7 @@ class JobsTreeApp(App[int]):
                 job_id=job_id,
                 job_type="serverless",
                 serverless_client=self._serverless_client,
+                executor=self._executor,
             )
             self.push_screen(stop_screen)
 
@@ -478,12 +583,13 @@ class JobsTreeApp(App[int]):
                 return
             # Don't allow stopping terminal runtime jobs
             runtime_status = self._runtime_status.get(runtime_job_id, "")
-            if _is_terminal_status(runtime_status):
+            if is_terminal_status(runtime_status):
                 return
             stop_screen = StopConfirmScreen(
                 job_id=runtime_job_id,
                 job_type="runtime",
                 runtime_service=self._runtime_state.runtime_service,
+                executor=self._executor,
             )
             self.push_screen(stop_screen)
 
@@ -501,17 +607,74 @@ class JobsTreeApp(App[int]):
         if self._paused:
             return
 
-        self._spinner_frame = (self._spinner_frame + 1) % len(_SPINNER_FRAMES)
-        if self._runtime_state is not None:
-            self._runtime_state.attach_runtime_rows(self._rows)
+        self._sync_runtime_rows()
         self._kick_fetch_if_due()
-        self._detect_changes()
         self._render_status()
-        self._render_tree()
-        # Force tree refresh to ensure new nodes are visible
-        tree_query = self.query("#jobs")
-        if tree_query:
-            tree_query.first(Tree).refresh()
+        now = time.monotonic()
+        # Relative ages ("5s ago") still need a redraw about once per second.
+        if not self._tree_dirty and now - self._last_tree_render_at < 1.0:
+            return
+        self._redraw_tree()
+
+    def _sync_runtime_rows(self) -> None:
+        """Re-attach runtime data to rows if the runtime cache changed."""
+        if (
+            self._runtime_state is not None
+            and self._runtime_state.revision != self._runtime_revision
+        ):
+            self._runtime_revision = self._runtime_state.revision
+            self._runtime_state.attach_runtime_rows(self._rows)
+            self._tree_dirty = True
+
+    class RuntimeChanged(Message):
+        """Runtime data changed; posted from the runtime worker thread."""
+
+    def _on_runtime_change(self) -> None:
+        """Called from the runtime worker thread when runtime data changed."""
+        # post_message is thread-safe and, unlike call_from_thread, does not
+        # wait for the app loop, which may itself be joining the worker in
+        # on_unmount.
+        self.post_message(self.RuntimeChanged())
+
+    def on_jobs_tree_app_runtime_changed(self, _message: RuntimeChanged) -> None:
+        """Coalesce a burst of runtime updates into one debounced redraw."""
+        if self._render_scheduled:
+            return
+        self._render_scheduled = True
+        self.set_timer(RUNTIME_RENDER_DEBOUNCE_SECONDS, self._deferred_render)
+
+    def _deferred_render(self) -> None:
+        self._render_scheduled = False
+        if self._paused:
+            return
+        self._sync_runtime_rows()
+        if self._tree_dirty:
+            self._redraw_tree()
+
+    def _redraw_tree(self) -> None:
+        self._detect_changes()
+        # Force tree refresh to ensure new nodes are visible, but only when
+        # a node was actually added, removed or relabeled.
+        if self._render_tree():
+            self._tree.refresh()
+
+    def _animate_spinners(self) -> None:
+        """Advance the status line spinner and the tree nodes that show one."""
+        if self._paused:
+            return
+        if self._fetch_inflight and not self._modal_active:
+            # The Rich spinner picks its frame from the clock on each redraw
+            self._status_widget.refresh()
+        if not self._animating_nodes:
+            return
+        self._spinner_frame = (self._spinner_frame + 1) % _SPINNER_FRAME_COUNT
+        for key, (node, data, is_job) in self._animating_nodes.items():
+            if is_job:
+                label, changed = self._job_label(key, data, loading_runtimes=True)
+            else:
+                label, changed = self._runtime_label(key, data)
+            if changed:
+                node.set_label(label)
 
     def _detect_changes(self) -> None:
         """Detect any changes to reset the auto-pause timer."""
@@ -553,63 +716,73 @@ class JobsTreeApp(App[int]):
         self._fetch_inflight = True
         if self._first_fetch:
             self._status_text = "Loading serverless jobs..."
-        thread = threading.Thread(target=self._fetch_once, daemon=True)
-        thread.start()
+        self.run_worker(self._fetch_once(), group="fetch")
 
-    def _fetch_once(self) -> None:
+    async def _fetch_once(self) -> None:
         try:
-            if self._serverless_client is None or self._runtime_state is None:
-                serverless_client, runtime_service = build_clients()
-                self._serverless_client = serverless_client
-                self._runtime_state = RuntimeState(
-                    runtime_service=runtime_service,
-                    serverless_client=serverless_client,
-                    interval=self.options.interval,
-                )
-                self._runtime_state.start()
-
-            assert self._serverless_client is not None
-            rows = fetch_serverless_rows(
-                client=self._serverless_client,
-                statuses=self.options.status,
-                created_after_iso=None,
-                limit=self.options.limit,
-                offset=self.options.offset,
+            rows = await _run_blocking(self._executor, self._load_rows)
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            self._apply_fetch_result(None, str(error))
+            return
+        self._apply_fetch_result(rows, None)
+
+    def _load_rows(self) -> list[dict[str, Any]]:
+        """Fetch rows and queue runtime discovery; runs in a worker thread."""
+        if self._serverless_client is None or self._runtime_state is None:
+            clients = build_clients()
+            serverless_client, runtime_service = clients.serverless, clients.runtime
+            self._serverless_client = serverless_client
+            self._runtime_state = RuntimeState(
+                runtime_service=runtime_service,
+                serverless_client=serverless_client,
+                interval=self.options.interval,
+                on_change=self._on_runtime_change,
             )
+            self._runtime_state.start()
+
+        assert self._serverless_client is not None
+        rows = fetch_serverless_rows(
+            client=self._serverless_client,
+            statuses=self.options.status,
+            created_after_iso=None,
+            limit=self.options.limit,
+            offset=self.options.offset,
+        )
 
-            if self.options.job_id:
-                rows = [row for row in rows if row.get("job_id") == self.options.job_id]
-            if self.options.function:
-                rows = [row for row in rows if row.get("function") == self.options.function]
-
-            assert self._runtime_state is not None
-            # Separate terminal and non-terminal jobs for different refresh strategies
-            terminal_job_ids = [
-                str(row.get("job_id"))
-                for row in rows
-                if _is_terminal_status(row.get("status"))
-            ]
-            if self._first_fetch:
-                self._runtime_state.freeze_terminal_jobs(terminal_job_ids)
-                self._initial_terminal_jobs = set(terminal_job_ids)
-            active_job_ids = [
-                str(row.get("job_id"))
-                for row in rows
-                if not _is_terminal_status(row.get("status"))
-            ]
-            # Non-terminal jobs get continuous status refresh
-            self._runtime_state.enqueue_runtime_discovery(
-                serverless_job_ids=active_job_ids,
-                is_terminal=False,
-            )
-            # Terminal jobs only get discovery, status refresh on expand
-            self._runtime_state.enqueue_runtime_discovery(
-                serverless_job_ids=terminal_job_ids,
-                is_terminal=True,
-            )
-            self.call_from_thread(self._apply_fetch_result, rows, None)
-        except Exception as error:  # pylint: disable=broad-exception-caught
-            self.call_from_thread(self._apply_fetch_result, None, str(error))
+        assert self._runtime_state is not None
+        # Apply the job/function filters and separate terminal and non-terminal
+        # jobs (different refresh strategies) in a single pass
+        wanted_job_id = self.options.job_id
+        wanted_function = self.options.function
+        filtered_rows: list[dict[str, Any]] = []
+        terminal_job_ids: list[str] = []
+        active_job_ids: list[str] = []
+        for row in rows:
+            if wanted_job_id and row.get("job_id") != wanted_job_id:
+                continue
+            if wanted_function and row.get("function") != wanted_function:
+                continue
+            filtered_rows.append(row)
+            (
+                terminal_job_ids
+                if is_terminal_status(row.get("status"))
+                else active_job_ids
+            ).append(str(row.get("job_id")))
+        rows = filtered_rows
+        if self._first_fetch:
+            self._runtime_state.freeze_terminal_jobs(terminal_job_ids)
+            self._initial_terminal_jobs = set(terminal_job_ids)
+        # Non-terminal jobs get continuous status refresh
+        self._runtime_state.enqueue_runtime_discovery(
+            serverless_job_ids=active_job_ids,
+            is_terminal=False,
+        )
+        # Terminal jobs only get discovery, status refresh on expand
+        self._runtime_state.enqueue_runtime_discovery(
+            serverless_job_ids=terminal_job_ids,
+            is_terminal=True,
+        )
+        return rows
 
     def _apply_fetch_result(
         self, rows: list[dict[str, Any]] | None, error: str | None
@@ -619,22 +792,49 @@ class JobsTreeApp(App[int]):
             self._last_error = error
             self._status_text = f"Error: {error}"
             self._next_fetch_at = time.monotonic() + max(1, self.options.interval)
+            self._render_status()
             return
 
         self._last_error = None
         self._rows = rows or []
+        # Parse creation times once per fetch so sorting compares floats.
+        for row in self._rows:
+            row["_created_ts"] = created_timestamp(row.get("created"))
+        # In place: the API returns rows nearly in creation order, which
+        # Timsort handles in close to linear time.
+        self._rows.sort(key=itemgetter("_created_ts"), reverse=True)
+        self._rows_sorted = self._rows[: max(1, self.options.limit)]
+        self._current_job_ids = {
+            _field_or_blank(row.get("job_id")) or "(unknown)"
+            for row in self._rows_sorted
+        }
+        if self._runtime_state is not None:
+            self._runtime_state.attach_runtime_rows(self._rows)
+        self._tree_dirty = True
         self._first_fetch = False
         self._next_fetch_at = time.monotonic() + self.options.interval
         self._status_text = ""
+        self._render_status()
+        # New data is drawn right away instead of waiting for the next data tick.
+        if not self._paused:
+            self._redraw_tree()
+
+    @property
+    def _modal_active(self) -> bool:
+        """True while a modal screen sits on top of the jobs screen."""
+        return len(self.screen_stack) > 1
 
     def _render_status(self) -> None:
-        status_query = self.query("#status")
-        if not status_query:
+        if self._modal_active:
             return  # Modal is active, skip rendering
-        status = status_query.first(Static)
+        status = self._status_widget
+        sig = (self._fetch_inflight, self._last_error is not None, self._status_text)
+        if sig == self._last_status_sig:
+            return  # The spinner is advanced by _animate_spinners
+        self._last_status_sig = sig
         if self._fetch_inflight:
             row = Table.grid(padding=(0, 1))
-            row.add_row(Spinner("dots", style="bright_black"), Text(self._status_text))
+            row.add_row(self._status_spinner, Text(self._status_text))
             status.update(row)
             return
         if self._last_error:
@@ -642,103 +842,174 @@ class JobsTreeApp(App[int]):
             return
         status.update("")
 
-    def _make_job_label(
-        self, row: dict[str, Any], loading_runtimes: bool = False
-    ) -> Text:
+    def _spinner_char(self) -> str:
+        """Current frame of the tree label spinner."""
+        return _SPINNER_FRAMES[self._spinner_frame]
+
+    def _make_job_label(self, row: dict[str, Any], created: str | None) -> Text:
+        """Build the job label without the spinner suffix."""
         job_id = _field_or_blank(row.get("job_id")) or "(unknown)"
         combined_status = _combined_status(row.get("status"), row.get("sub_status"))
-        created = (
-            relative_created(row.get("created"))
-            if row.get("created")
-            else "(unknown)"
+        label = Text(_field_or_blank(row.get("function")) or "(unknown)")
+        label.append(" ")
+        label.append(job_id, style=self._style_bright_white)
+        label.append(" ")
+        label.append(
+            combined_status or "(unknown)",
+            style=_status_style(combined_status, self.options.no_color),
         )
-        parts: list[Text | str] = [
-            Text(_field_or_blank(row.get("function")) or "(unknown)"),
-            " ",
-            Text(job_id, style=None if self.options.no_color else "bright_white"),
-            " ",
-            Text(
-                combined_status or "(unknown)",
-                style=_status_style(combined_status, self.options.no_color),
-            ),
-            " ",
-            Text(created, style=None if self.options.no_color else "bright_black"),
-        ]
-        if loading_runtimes:
-            spinner_char = _SPINNER_FRAMES[self._spinner_frame]
-            parts.append(" ")
-            parts.append(
-                Text(spinner_char, style=None if self.options.no_color else "bright_black")
-            )
-        return Text.assemble(*parts)
+        label.append(" ")
+        label.append(created or "(unknown)", style=self._style_bright_black)
+        return label
+
+    def _with_spinner(self, prefix: Text) -> Text:
+        """Copy of a prebuilt label with the current spinner frame appended."""
+        label = prefix.copy()
+        label.append(" ")
+        label.append(self._spinner_char(), style=self._style_bright_black)
+        return label
 
     def _make_runtime_label(self, runtime: dict[str, Any]) -> Text:
         runtime_status = _field_or_blank(runtime.get("status"))
         backend = _field_or_blank(runtime.get("backend"))
         runtime_id = _field_or_blank(runtime.get("runtime_job_id")) or "(unknown)"
+        label = Text(runtime_id, style=self._style_bright_white)
 
         # Show spinner when status is unknown (still loading)
         if not runtime_status:
-            spinner_char = _SPINNER_FRAMES[self._spinner_frame]
-            return Text.assemble(
-                Text(
-                    runtime_id,
-                    style=None if self.options.no_color else "bright_white",
-                ),
-                " ",
-                Text(spinner_char, style=None if self.options.no_color else "bright_black"),
-            )
+            label.append(" ")
+            label.append(self._spinner_char(), style=self._style_bright_black)
+            return label
 
-        runtime_spinning = not _is_terminal_status(runtime_status)
+        runtime_spinning = not is_terminal_status(runtime_status)
         backend_display = (
             "(unknown)"
             if runtime_spinning and (not backend or backend == "(unknown)")
             else (backend or "(unknown)")
         )
-        return Text.assemble(
-            Text(
-                runtime_id,
-                style=None if self.options.no_color else "bright_white",
-            ),
-            " ",
-            Text(
-                runtime_status,
-                style=_status_style(runtime_status, self.options.no_color),
-            ),
-            " ",
-            Text(
-                backend_display,
-                style=None if self.options.no_color else "bright_black",
-            ),
+        label.append(" ")
+        label.append(
+            runtime_status,
+            style=_status_style(runtime_status, self.options.no_color),
+        )
+        label.append(" ")
+        label.append(backend_display, style=self._style_bright_black)
+        return label
+
+    def _job_label(
+        self, job_id: str, row: dict[str, Any], loading_runtimes: bool
+    ) -> tuple[Text, bool]:
+        """Return the job label and whether it differs from the last one built.
+
+        Only the spinner suffix changes between animation frames, so the rest
+        of the label is kept and reused while its inputs are unchanged.
+        """
+        created_text = self._created_texts.get(job_id)
+        sig = (
+            row.get("function"),
+            job_id,
+            row.get("status"),
+            row.get("sub_status"),
+            created_text,
+        )
+        frame = self._spinner_frame if loading_runtimes else None
+        cached = self._job_label_cache.get(job_id)
+        if cached is not None and cached[0] == sig:
+            if cached[1] == frame:
+                return cached[3], False
+            prefix = cached[2]
+        else:
+            prefix = self._make_job_label(row, created_text)
+        label = prefix if frame is None else self._with_spinner(prefix)
+        self._job_label_cache[job_id] = (sig, frame, prefix, label)
+        return label, True
+
+    def _runtime_label(
+        self, runtime_id: str, runtime: dict[str, Any]
+    ) -> tuple[Text, bool]:
+        """Return the runtime label and whether it differs from the last one built."""
+        status = runtime.get("status")
+        sig = (
+            status,
+            runtime.get("backend"),
+            self._spinner_frame if not _field_or_blank(status) else None,
         )
+        cached = self._runtime_label_cache.get(runtime_id)
+        if cached is not None and cached[0] == sig:
+            return cached[1], False
+        label = self._make_runtime_label(runtime)
+        self._runtime_label_cache[runtime_id] = (sig, label)
+        return label, True
+
+    def _render_fingerprint(self) -> tuple[Any, ...]:
+        """Everything _render_tree reads from the rows, as one comparable tuple.
+
+        Also refreshes the age texts _job_label reads, all against one ``now``.
+        """
+        runtime_state = self._runtime_state
+        now = datetime.now(timezone.utc)
+        created_texts: dict[str, str | None] = {}
+        fingerprint = []
+        for row in self._rows_sorted:
+            job_id = _field_or_blank(row.get("job_id")) or "(unknown)"
+            created = row.get("created")
+            created_text = relative_created(created, now) if created else None
+            created_texts[job_id] = created_text
+            fingerprint.append(
+                (
+                    job_id,
+                    row.get("function"),
+                    row.get("status"),
+                    row.get("sub_status"),
+                    created_text,
+                    runtime_state.get_runtime_count(job_id)
+                    if runtime_state is not None
+                    else None,
+                    tuple(
+                        (rt.get("runtime_job_id"), rt.get("status"), rt.get("backend"))
+                        for rt in row.get("runtime_jobs") or ()
+                    ),
+                )
+            )
+        self._created_texts = created_texts
+        return tuple(fingerprint)
 
-    def _render_tree(self) -> None:
-        tree_query = self.query("#jobs")
-        if not tree_query:
-            return  # Modal is active, skip rendering
-        tree = tree_query.first(Tree)
-        root = tree.root
+    def _render_tree(self) -> bool:
+        """Sync the tree with the current rows; return True if any node changed."""
+        if self._modal_active:
+            return False  # Modal is active, skip rendering
+        root = self._tree.root
 
         # Ensure root is always expanded
         if not root.is_expanded:
             root.expand()
 
-        rows_sorted = sorted(
-            self._rows, key=lambda row: str(row.get("created") or ""), reverse=True
-        )[: max(1, self.options.limit)]
+        self._tree_dirty = False
+        self._last_tree_render_at = time.monotonic()
+        # Nothing visible changed since the last pass: skip the per-row sync.
+        # Spinner frames are animated separately and are not part of this.
+        fingerprint = self._render_fingerprint()
+        if fingerprint == self._last_render_fingerprint:
+            return False
+        self._last_render_fingerprint = fingerprint
+        animating_nodes: dict[str, tuple[Any, dict[str, Any], bool]] = {}
+        changed = False
 
-        current_job_ids = {
-            _field_or_blank(row.get("job_id")) or "(unknown)" for row in rows_sorted
-        }
+        # Runtime attachment mutates rows in place, so the order stays valid.
+        rows_sorted = self._rows_sorted
+        current_job_ids = self._current_job_ids
 
         # Remove jobs that no longer exist
         stale_job_ids = set(self._job_nodes.keys()) - current_job_ids
         for job_id in stale_job_ids:
             node = self._job_nodes.pop(job_id, None)
+            self._job_label_cache.pop(job_id, None)
+            self._runtime_nodes.pop(job_id, None)
             self._job_terminal_status.pop(job_id, None)
             self._job_runtime_count.pop(job_id, None)
             if node is not None:
                 node.remove()
+                changed = True
 
         visible_runtime_ids: set[str] = set()
 
@@ -747,7 +1018,7 @@ class JobsTreeApp(App[int]):
         for row in reversed(rows_sorted):
             job_id = _field_or_blank(row.get("job_id")) or "(unknown)"
             base_status = _field_or_blank(row.get("status"))
-            is_terminal = _is_terminal_status(base_status)
+            is_terminal = is_terminal_status(base_status)
 
             # Check runtime discovery status for terminal jobs
             runtime_count: int | None = None
@@ -756,12 +1027,16 @@ class JobsTreeApp(App[int]):
 
             # Show spinner for non-terminal jobs (can receive new runtime jobs anytime)
             loading_runtimes = not is_terminal
-            job_label = self._make_job_label(row, loading_runtimes=loading_runtimes)
+            job_label, job_label_changed = self._job_label(
+                job_id, row, loading_runtimes
+            )
 
             if job_id in self._job_nodes:
                 # Update existing node
                 job_node = self._job_nodes[job_id]
-                job_node.set_label(job_label)
+                if job_label_changed:
+                    job_node.set_label(job_label)
+                    changed = True
 
                 # Detect transition from non-terminal to terminal
                 was_terminal = self._job_terminal_status.get(job_id, False)
@@ -795,6 +1070,10 @@ class JobsTreeApp(App[int]):
                     )
                 self._job_nodes[job_id] = job_node
                 self._job_terminal_status[job_id] = is_terminal
+                changed = True
+
+            if loading_runtimes:
+                animating_nodes[job_id] = (job_node, row, True)
 
             # Update runtime children
             runtimes = row.get("runtime_jobs", []) or []
@@ -830,16 +1109,16 @@ class JobsTreeApp(App[int]):
                 for rt in runtimes
             }
 
-            # Build index of existing runtime nodes
-            existing_runtime_nodes: dict[str, Any] = {}
-            for child in list(job_node.children):
-                data = child.data or {}
-                if data.get("type") == "runtime":
-                    rt_id = data.get("runtime_job_id", "")
-                    if preserve_existing_runtime_children or rt_id in current_runtime_ids:
-                        existing_runtime_nodes[rt_id] = child
-                    else:
-                        child.remove()
+            # Existing runtime nodes of this job, dropping the ones that vanished
+            existing_runtime_nodes = self._runtime_nodes.setdefault(job_id, {})
+            if not preserve_existing_runtime_children:
+                for rt_id in [
+                    rt_id
+                    for rt_id in existing_runtime_nodes
+                    if rt_id not in current_runtime_ids
+                ]:
+                    existing_runtime_nodes.pop(rt_id).remove()
+                    changed = True
 
             if preserve_existing_runtime_children:
                 visible_runtime_ids.update(existing_runtime_nodes.keys())
@@ -847,7 +1126,9 @@ class JobsTreeApp(App[int]):
             for runtime in runtimes:
                 runtime_id = _field_or_blank(runtime.get("runtime_job_id")) or "(unknown)"
                 visible_runtime_ids.add(runtime_id)
-                runtime_label = self._make_runtime_label(runtime)
+                runtime_label, runtime_label_changed = self._runtime_label(
+                    runtime_id, runtime
+                )
                 runtime_status = _field_or_blank(runtime.get("status"))
                 previous_runtime_status = self._runtime_status.get(runtime_id, "")
                 status_changed = (
@@ -857,9 +1138,12 @@ class JobsTreeApp(App[int]):
                 self._runtime_status[runtime_id] = runtime_status
 
                 if runtime_id in existing_runtime_nodes:
-                    existing_runtime_nodes[runtime_id].set_label(runtime_label)
+                    runtime_node = existing_runtime_nodes[runtime_id]
+                    if runtime_label_changed:
+                        runtime_node.set_label(runtime_label)
+                        changed = True
                 else:
-                    job_node.add_leaf(
+                    runtime_node = job_node.add_leaf(
                         runtime_label,
                         data={
                             "type": "runtime",
@@ -867,10 +1151,21 @@ class JobsTreeApp(App[int]):
                             "runtime_job_id": runtime_id,
                         },
                     )
+                    existing_runtime_nodes[runtime_id] = runtime_node
+                    changed = True
+
+                # Runtimes without a status yet show a spinner
+                if not runtime_status:
+                    animating_nodes[runtime_id] = (runtime_node, runtime, False)
 
                 if status_changed and job_id not in self._initial_terminal_jobs:
                     job_node.expand()
 
+        self._animating_nodes = animating_nodes
+
         stale_runtime_ids = set(self._runtime_status.keys()) - visible_runtime_ids
         for runtime_id in stale_runtime_ids:
             self._runtime_status.pop(runtime_id, None)
+            self._runtime_label_cache.pop(runtime_id, None)
+
+        return changed
@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import os
+import signal
 import sys
 import time
+from collections.abc import KeysView
+from concurrent.futures import FIRST_COMPLETED, Future, wait
 from datetime import datetime, timezone
+from functools import partial
+from operator import itemgetter
+from threading import Event
+from typing import Any, TypeVar
 
 from .config import (
     DEFAULT_CHANNEL,
@@ -18,13 +24,35 @@ from .config import (
     ENV_QISKIT_IBM_INSTANCE,
     ENV_QISKIT_IBM_TOKEN,
     ENV_QISKIT_IBM_URL,
+    ClientBundle,
     WatchOptions,
     build_clients,
 )
+from .executor import DaemonThreadPoolExecutor
 from .fetch import fetch_serverless_rows
+from .ndjson import RecordWriter, dumps
 from .runtime import RuntimeState
+from .status import is_terminal_status
 from .tui import JobsTreeApp
 
+_T = TypeVar("_T")
+
+_NOISY_QISKIT_LOGGERS = (
+    "qiskit_runtime_service",
+    "qiskit_runtime_service._discover_account",
+    "qiskit_ibm_runtime",
+)
+# Growth of the --adaptive polling interval after a fetch with no changes
+ADAPTIVE_BACKOFF_FACTOR = 1.5
+# With --dedupe, seconds between heartbeats while the snapshot is unchanged
+DEDUPE_HEARTBEAT_SECONDS = 30.0
+_NS_PER_SECOND = 1_000_000_000
+_DEDUPE_HEARTBEAT_NS = int(DEDUPE_HEARTBEAT_SECONDS * _NS_PER_SECOND)
+# Longest stretch a wait goes without checking whether Ctrl+C was pressed
+STOP_CHECK_SECONDS = 0.1
+# Every fetched row carries these keys (see fetch._to_summary_rows)
+_ROW_FIELDS = itemgetter("job_id", "function", "status")
+
 
 def _mask_secret(value: str | None) -> str:
     if not value:
@@ -35,11 +63,12 @@ def _mask_secret(value: str | None) -> str:
 
 
 def _print_startup_env() -> None:
-    gateway_host = os.getenv(ENV_GATEWAY_PROVIDER_HOST, DEFAULT_GATEWAY_HOST)
-    runtime_url = os.getenv(ENV_QISKIT_IBM_URL, DEFAULT_RUNTIME_URL)
-    runtime_channel = os.getenv(ENV_QISKIT_IBM_CHANNEL, DEFAULT_CHANNEL)
-    instance = os.getenv(ENV_QISKIT_IBM_INSTANCE)
-    token = os.getenv(ENV_QISKIT_IBM_TOKEN)
+    env = os.environ
+    gateway_host = env.get(ENV_GATEWAY_PROVIDER_HOST, DEFAULT_GATEWAY_HOST)
+    runtime_url = env.get(ENV_QISKIT_IBM_URL, DEFAULT_RUNTIME_URL)
+    runtime_channel = env.get(ENV_QISKIT_IBM_CHANNEL, DEFAULT_CHANNEL)
+    instance = env.get(ENV_QISKIT_IBM_INSTANCE)
+    token = env.get(ENV_QISKIT_IBM_TOKEN)
 
     print("Environment in use:")
     print(f"  {ENV_GATEWAY_PROVIDER_HOST}={gateway_host}")
@@ -51,86 +80,342 @@ def _print_startup_env() -> None:
 
 
 def _suppress_noisy_qiskit_logs() -> None:
-    noisy_loggers = (
-        "qiskit_runtime_service",
-        "qiskit_runtime_service._discover_account",
-        "qiskit_ibm_runtime",
-    )
-    for logger_name in noisy_loggers:
+    # The level gate makes isEnabledFor() reject records before they are built;
+    # errors are still reported.
+    for logger_name in _NOISY_QISKIT_LOGGERS:
         logger = logging.getLogger(logger_name)
         logger.setLevel(logging.ERROR)
         logger.propagate = False
 
 
-def _run_json_watch(options: WatchOptions) -> int:
-    serverless_client, runtime_service = build_clients()
+def _next_poll_interval(current: float, changed: bool, options: WatchOptions) -> float:
+    """Seconds until the next fetch; fixed unless ``options.adaptive`` is set.
+
+    Any change snaps back to ``options.interval``; otherwise the interval grows
+    by ``ADAPTIVE_BACKOFF_FACTOR`` up to ``options.max_interval``.
+    """
+    if not options.adaptive or changed:
+        return float(options.interval)
+    return min(current * ADAPTIVE_BACKOFF_FACTOR, float(options.max_interval))
+
+
+def _install_stop_handler(stop_event: Event) -> Any:
+    """Make Ctrl+C set ``stop_event``; a second Ctrl+C interrupts right away.
+
+    Returns the previous SIGINT handler so the caller can restore it.
+    """
+
+    def _on_sigint(_signum: int, _frame: Any) -> None:
+        if stop_event.is_set():
+            raise KeyboardInterrupt
+        stop_event.set()
+
+    return signal.signal(signal.SIGINT, _on_sigint)
+
+
+def _wait_for_result(
+    future: Future[_T], timeout: float | None, stop_event: Event
+) -> tuple[bool, _T | None]:
+    """Wait up to ``timeout`` seconds (None: no limit) for ``future``.
+
+    Returns ``(done, result)``. The wait is sliced so it ends within
+    ``STOP_CHECK_SECONDS`` once ``stop_event`` is set, instead of sitting
+    out a slow request after Ctrl+C.
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    while not stop_event.is_set():
+        slice_seconds = STOP_CHECK_SECONDS
+        if deadline is not None:
+            slice_seconds = min(slice_seconds, deadline - time.monotonic())
+            if slice_seconds <= 0:
+                break
+        done, _ = wait((future,), timeout=slice_seconds, return_when=FIRST_COMPLETED)
+        if done:
+            return True, future.result()
+    return False, None
+
+
+def _start_runtime_state(
+    clients: ClientBundle, interval: int, terminal_job_ids: list[str]
+) -> RuntimeState:
+    """Build the runtime tracker once the runtime client is ready and start it."""
     runtime_state = RuntimeState(
-        runtime_service=runtime_service,
-        serverless_client=serverless_client,
-        interval=options.interval,
+        runtime_service=clients.runtime,
+        serverless_client=clients.serverless,
+        interval=interval,
     )
+    # Frozen before the worker starts so discovery never races the freeze
+    runtime_state.freeze_terminal_jobs(terminal_job_ids)
     runtime_state.start()
-    rows: list[dict[str, object]] = []
-    next_fetch_at = 0.0
-    first_fetch = True
+    return runtime_state
+
+
+def _stop_runtime_state(
+    runtime_state: RuntimeState | None,
+    runtime_future: Future[RuntimeState] | None,
+) -> None:
+    """Stop the runtime tracker, including one still starting in the background."""
+    if runtime_state is not None:
+        runtime_state.stop()
+    elif runtime_future is not None and not runtime_future.cancel():
+        # Still starting (or just started): stop it once it is up
+        runtime_future.add_done_callback(_stop_started_runtime_state)
+
+
+def _stop_started_runtime_state(runtime_future: Future[RuntimeState]) -> None:
+    if runtime_future.exception() is None:
+        runtime_future.result().stop()
+
+
+def _filter_rows(
+    rows: list[dict[str, object]],
+    wanted_job_id: str | None,
+    wanted_function: str | None,
+) -> tuple[list[dict[str, object]], dict[str, object], list[str]]:
+    """Apply the ``--job-id``/``--function`` filters in a single pass.
+
+    Returns the kept rows, their statuses keyed by job id (in row order) and
+    the ids of the jobs that are already terminal.
+    """
+    filtered_rows: list[dict[str, object]] = []
+    statuses: dict[str, object] = {}
+    terminal_job_ids: list[str] = []
+    for row in rows:
+        raw_job_id, function, status = _ROW_FIELDS(row)
+        if wanted_job_id and raw_job_id != wanted_job_id:
+            continue
+        if wanted_function and function != wanted_function:
+            continue
+        filtered_rows.append(row)
+        job_id = str(raw_job_id)
+        statuses[job_id] = status
+        if is_terminal_status(status):
+            terminal_job_ids.append(job_id)
+    return filtered_rows, statuses, terminal_job_ids
+
+
+def _sync_runtime_ids(
+    runtime_state: RuntimeState,
+    tracked_job_ids: KeysView[str],
+    current_job_ids: KeysView[str],
+) -> None:
+    """Tell the runtime tracker which jobs appeared or disappeared."""
+    added_job_ids = [
+        job_id for job_id in current_job_ids if job_id not in tracked_job_ids
+    ]
+    if added_job_ids:
+        runtime_state.enqueue_runtime_discovery(serverless_job_ids=added_job_ids)
+    removed_job_ids = tracked_job_ids - current_job_ids
+    if removed_job_ids:
+        runtime_state.forget_runtime_discovery(list(removed_job_ids))
+
+
+def _build_record(refreshed_at: str, rows_json: bytes | None) -> bytes:
+    """Encode one output record; ``rows_json=None`` gives a dedupe heartbeat.
+
+    Equal to ``dumps({"refreshed_at": ..., "rows": rows})``, with the rows
+    passed already encoded so unchanged rows are not encoded again.
+    """
+    if rows_json is None:
+        return dumps({"refreshed_at": refreshed_at, "unchanged": True})
+    head = dumps({"refreshed_at": refreshed_at})
+    return head[:-1] + b',"rows":' + rows_json + b"}"
+
+
+class _JsonWatch:
+    """State of one ``--json`` watch run.
+
+    Snapshots are emitted every ``--interval``; with ``--adaptive`` only the
+    fetch cadence backs off, so runtime updates still show promptly.
+    """
+
+    def __init__(self, options: WatchOptions, stop_event: Event) -> None:
+        self._options = options
+        self._stop_event = stop_event
+        self._clients = build_clients()
+        # Options read on every iteration, bound once
+        self._fetch_rows = partial(
+            fetch_serverless_rows,
+            statuses=options.status,
+            created_after_iso=None,
+            limit=options.limit,
+            offset=options.offset,
+        )
+        self._wanted_job_id = options.job_id
+        self._wanted_function = options.function
+        self._dedupe = options.dedupe
+        self._emit_interval = float(options.interval)
+        self._poll_interval = self._emit_interval
+        # Fetches run in the background so a slow gateway does not stall
+        # output; daemon workers, so a hung fetch cannot block exit.
+        self._fetch_executor = DaemonThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="json-fetch"
+        )
+        self._pending_fetch: Future[list[dict[str, object]]] | None = None
+        self._fetch_started_at_ns = 0
+        self._next_fetch_at_ns = 0
+        self._first_fetch = True
+        # Built in the background after the first fetch, so neither the first
+        # fetch nor the first snapshot waits for the runtime client.
+        self._runtime_executor = DaemonThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="json-runtime"
+        )
+        self._runtime_future: Future[RuntimeState] | None = None
+        self._runtime_state: RuntimeState | None = None
+        self._rows: list[dict[str, object]] = []
+        self._statuses: dict[str, object] = {}
+        # Key views keep fetch order for discovery and support set differences;
+        # a new view per fetch tells the tracker sync when to run.
+        self._job_ids: KeysView[str] = self._statuses.keys()
+        self._tracked_job_ids = self._job_ids
+        self._rows_json = b"[]"
+        self._attached_revision = -1
+        self._last_rows_json: bytes | None = None
+        self._last_output_at_ns = 0
+        # Stdout writes happen on their own thread so a slow reader cannot
+        # stall polling
+        self._writer = RecordWriter()
+
+    def step(self) -> None:
+        """Run one iteration: collect fetched rows, sync runtime data, emit."""
+        now_ns = time.monotonic_ns()
+        fetched_rows = self._poll_fetch(now_ns)
+        if self._stop_event.is_set():
+            return
+        if fetched_rows is not None:
+            self._apply_fetch(fetched_rows)
+        self._sync_runtime()
+        self._encode_rows(fetched=fetched_rows is not None)
+        self._emit(now_ns)
+        # Returns as soon as Ctrl+C sets the event instead of sleeping it out
+        elapsed = (time.monotonic_ns() - now_ns) / _NS_PER_SECOND
+        self._stop_event.wait(max(0.0, self._emit_interval - elapsed))
+
+    def close(self) -> None:
+        """Stop the runtime tracker, write pending records and drop the pools."""
+        _stop_runtime_state(self._runtime_state, self._runtime_future)
+        self._writer.close()
+        self._fetch_executor.shutdown(wait=False, cancel_futures=True)
+        self._runtime_executor.shutdown(wait=False, cancel_futures=True)
+
+    def _fetch(self) -> list[dict[str, object]]:
+        """Blocking fetch; runs on the fetch executor."""
+        # The client is resolved here so its construction never blocks the loop
+        return self._fetch_rows(client=self._clients.serverless)
+
+    def _poll_fetch(self, now_ns: int) -> list[dict[str, object]] | None:
+        """Start a fetch when one is due; return its rows once it completes."""
+        if self._pending_fetch is None and now_ns >= self._next_fetch_at_ns:
+            self._pending_fetch = self._fetch_executor.submit(self._fetch)
+            self._fetch_started_at_ns = now_ns
+        if self._pending_fetch is None:
+            return None
+        # Wait at most one emit interval (no limit before the first snapshot);
+        # a slower fetch is picked up on a later iteration while the previous
+        # rows keep being printed.
+        done, rows = _wait_for_result(
+            self._pending_fetch,
+            None if self._first_fetch else self._emit_interval,
+            self._stop_event,
+        )
+        if done:
+            self._pending_fetch = None
+        return rows
+
+    def _apply_fetch(self, fetched_rows: list[dict[str, object]]) -> None:
+        """Keep the filtered rows and schedule the next fetch."""
+        options = self._options
+        rows, statuses, terminal_job_ids = _filter_rows(
+            fetched_rows, self._wanted_job_id, self._wanted_function
+        )
+        if self._first_fetch:
+            self._runtime_future = self._runtime_executor.submit(
+                _start_runtime_state, self._clients, options.interval, terminal_job_ids
+            )
+            self._first_fetch = False
+        self._poll_interval = _next_poll_interval(
+            self._poll_interval, statuses != self._statuses, options
+        )
+        self._rows = rows
+        self._statuses = statuses
+        self._job_ids = statuses.keys()
+        self._next_fetch_at_ns = self._fetch_started_at_ns + int(
+            self._poll_interval * _NS_PER_SECOND
+        )
+
+    def _sync_runtime(self) -> None:
+        """Pick up the runtime tracker once started and keep its job list current."""
+        if self._runtime_state is None:
+            future = self._runtime_future
+            if future is None or not future.done():
+                return
+            self._runtime_state = future.result()
+        if self._tracked_job_ids is not self._job_ids:
+            _sync_runtime_ids(self._runtime_state, self._tracked_job_ids, self._job_ids)
+            self._tracked_job_ids = self._job_ids
+
+    def _encode_rows(self, fetched: bool) -> None:
+        """Re-encode the rows only after a fetch or a runtime data change."""
+        runtime_state = self._runtime_state
+        if runtime_state is None:
+            if fetched:
+                # Same shape as attach_runtime_rows while the runtime client
+                # is still starting.
+                for row in self._rows:
+                    row["runtime_jobs"] = []
+                self._rows_json = dumps(self._rows)
+            return
+        revision = runtime_state.revision
+        if fetched or revision != self._attached_revision:
+            runtime_state.attach_runtime_rows(self._rows)
+            self._attached_revision = revision
+            self._rows_json = dumps(self._rows)
+
+    def _emit(self, now_ns: int) -> None:
+        """Queue the snapshot, or a periodic heartbeat while --dedupe holds it."""
+        rows_json: bytes | None = self._rows_json
+        if self._dedupe and rows_json == self._last_rows_json:
+            if now_ns - self._last_output_at_ns < _DEDUPE_HEARTBEAT_NS:
+                return
+            rows_json = None
+        else:
+            self._last_rows_json = rows_json
+        refreshed_at = datetime.now(timezone.utc).isoformat()
+        self._writer.put(_build_record(refreshed_at, rows_json))
+        self._last_output_at_ns = now_ns
+
+
+def _run_json_watch(options: WatchOptions) -> int:
+    stop_event = Event()
+    previous_sigint_handler = _install_stop_handler(stop_event)
+    watch: _JsonWatch | None = None
+    failure: Exception | None = None
 
     try:
-        while True:
-            now = time.monotonic()
-            if now >= next_fetch_at:
-                rows = fetch_serverless_rows(
-                    client=serverless_client,
-                    statuses=options.status,
-                    created_after_iso=None,
-                    limit=options.limit,
-                    offset=options.offset,
-                )
-
-                if options.job_id:
-                    rows = [row for row in rows if row.get("job_id") == options.job_id]
-                if options.function:
-                    rows = [
-                        row for row in rows if row.get("function") == options.function
-                    ]
-
-                terminal_job_ids = [
-                    str(row.get("job_id"))
-                    for row in rows
-                    if str(row.get("status") or "").strip().upper()
-                    in (
-                        "DONE",
-                        "SUCCEEDED",
-                        "ERROR",
-                        "FAILED",
-                        "CANCELED",
-                        "CANCELLED",
-                        "STOPPED",
-                    )
-                ]
-                if first_fetch:
-                    runtime_state.freeze_terminal_jobs(terminal_job_ids)
-                    first_fetch = False
-
-                runtime_state.enqueue_runtime_discovery(
-                    serverless_job_ids=[str(row.get("job_id")) for row in rows],
-                )
-                next_fetch_at = now + options.interval
-
-            runtime_state.attach_runtime_rows(rows)
-            payload = {
-                "refreshed_at": datetime.now(timezone.utc).isoformat(),
-                "rows": rows,
-            }
-            print(json.dumps(payload, default=str))
-            time.sleep(float(options.interval))
+        watch = _JsonWatch(options, stop_event)
+        while not stop_event.is_set():
+            watch.step()
     except KeyboardInterrupt:
-        runtime_state.stop()
-        print("\nExiting.")
-        return 0
+        pass
     except Exception as error:  # pylint: disable=broad-exception-caught
-        runtime_state.stop()
-        print(f"Error: {error}", file=sys.stderr)
+        failure = error
+    finally:
+        # Runs exactly once on every exit path, before the final message so
+        # queued records are written ahead of it. The handler is restored
+        # first: close() can block for a few seconds, and a Ctrl+C during it
+        # then abandons the cleanup instead of escaping as a traceback.
+        signal.signal(signal.SIGINT, previous_sigint_handler)
+        if watch is not None:
+            try:
+                watch.close()
+            except KeyboardInterrupt:
+                pass
+
+    if failure is not None:
+        print(f"Error: {failure}", file=sys.stderr)
         return 1
+    print("\nExiting.")
+    return 0
 
 
 def run_watch(options: WatchOptions) -> int:
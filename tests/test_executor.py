@@ -0,0 +1,56 @@
+import threading
+
+import pytest
+
+from qiskit_serverless_console.executor import DaemonThreadPoolExecutor
+
+
+def test_map_and_exceptions():
+    with DaemonThreadPoolExecutor(max_workers=2) as executor:
+        assert list(executor.map(lambda value: value * 2, range(5))) == [
+            0,
+            2,
+            4,
+            6,
+            8,
+        ]
+        future = executor.submit(lambda: 1 / 0)
+        with pytest.raises(ZeroDivisionError):
+            future.result(timeout=5)
+
+
+def test_workers_are_daemon_threads_and_capped():
+    executor = DaemonThreadPoolExecutor(max_workers=2, thread_name_prefix="test-io")
+    release = threading.Event()
+    futures = [executor.submit(release.wait, 5) for _ in range(4)]
+    assert len(executor._threads) == 2
+    assert all(thread.daemon for thread in executor._threads)
+    assert executor._threads[0].name == "test-io_0"
+    release.set()
+    assert all(future.result(timeout=5) for future in futures)
+    executor.shutdown()
+
+
+def test_shutdown_cancels_queued_work_and_rejects_new_work():
+    executor = DaemonThreadPoolExecutor(max_workers=1)
+    started = threading.Event()
+    release = threading.Event()
+
+    def _block() -> bool:
+        started.set()
+        return release.wait(5)
+
+    running = executor.submit(_block)
+    assert started.wait(5)
+    queued = executor.submit(lambda: None)
+    executor.shutdown(wait=False, cancel_futures=True)
+    assert queued.cancelled()
+    release.set()
+    assert running.result(timeout=5)
+    with pytest.raises(RuntimeError):
+        executor.submit(lambda: None)
+
+
+def test_max_workers_must_be_positive():
+    with pytest.raises(ValueError):
+        DaemonThreadPoolExecutor(max_workers=0)
@@ -0,0 +1,64 @@
+import json
+from threading import Event
+
+import pytest
+
+from qiskit_serverless_console import ndjson
+from qiskit_serverless_console.ndjson import RecordWriter, dumps
+
+
+class _Unserializable:
+    def __str__(self) -> str:
+        return "custom"
+
+
+def test_dumps_is_compact_and_stringifies_unknown_values():
+    record = dumps({"a": 1, "b": [True, None], "c": _Unserializable()})
+    assert isinstance(record, bytes)
+    assert b" " not in record
+    assert json.loads(record) == {"a": 1, "b": [True, None], "c": "custom"}
+
+
+def test_write_record_appends_newline(capsysbinary):
+    ndjson.write_record(b'{"a":1}')
+    ndjson.write_record(b'{"b":2}')
+    assert capsysbinary.readouterr().out == b'{"a":1}\n{"b":2}\n'
+
+
+def test_record_writer_drops_oldest_when_full(monkeypatch):
+    first_taken = Event()
+    release = Event()
+    written: list[bytes] = []
+
+    def _write(record: bytes) -> None:
+        if not written:
+            first_taken.set()
+            assert release.wait(5)
+        written.append(record)
+
+    monkeypatch.setattr(ndjson, "write_record", _write)
+    writer = RecordWriter(maxsize=2)
+    writer.put(b"0")
+    assert first_taken.wait(5)
+    # The writer thread is stuck on b"0"; only the newest two survive.
+    for index in range(1, 6):
+        writer.put(str(index).encode())
+    release.set()
+    writer.close()
+    assert written == [b"0", b"4", b"5"]
+
+
+def test_record_writer_reraises_write_error(monkeypatch):
+    failed = Event()
+
+    def _write(record: bytes) -> None:
+        failed.set()
+        raise BrokenPipeError("reader went away")
+
+    monkeypatch.setattr(ndjson, "write_record", _write)
+    writer = RecordWriter()
+    writer.put(b"0")
+    assert failed.wait(5)
+    writer.close()
+    with pytest.raises(BrokenPipeError):
+        writer.put(b"1")
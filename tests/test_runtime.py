@@ -0,0 +1,213 @@
+import math
+from threading import Event
+
+from qiskit_serverless_console.runtime import (
+    TTL_TOLERANCE_SECONDS,
+    WAITING_STATUS_TTL_SECONDS,
+    RuntimeState,
+)
+
+
+class _FakeRuntimeJob:
+    def __init__(self, service: "_FakeRuntimeService", runtime_id: str) -> None:
+        self._service = service
+        self._runtime_id = runtime_id
+        self.backend = "ibm_fake"
+
+    def status(self) -> str:
+        self._service.polls.append(self._runtime_id)
+        status = self._service.statuses[self._runtime_id]
+        if isinstance(status, Exception):
+            raise status
+        return status
+
+
+class _FakeRuntimeService:
+    def __init__(self) -> None:
+        self.statuses: dict[str, object] = {}
+        self.polls: list[str] = []
+
+    def job(self, runtime_id: str) -> _FakeRuntimeJob:
+        return _FakeRuntimeJob(self, runtime_id)
+
+
+class _FakeServerlessClient:
+    def __init__(self) -> None:
+        self.runtime_ids: dict[str, list[str]] = {}
+
+    def runtime_jobs(self, job_id: str) -> list[str]:
+        return self.runtime_ids.get(job_id, [])
+
+
+def _state(interval: int = 1, on_change=None):
+    service = _FakeRuntimeService()
+    client = _FakeServerlessClient()
+    state = RuntimeState(service, client, interval=interval, on_change=on_change)
+    return state, service, client
+
+
+def _discovered(state, client, job_id="job-1", runtime_ids=("rt-1",)):
+    client.runtime_ids[job_id] = list(runtime_ids)
+    state.enqueue_runtime_discovery([job_id])
+    state._discover_batch()
+
+
+def test_ttl_uses_tick_time_with_tolerance():
+    state, service, client = _state(interval=1)
+    _discovered(state, client)
+    service.statuses["rt-1"] = "RUNNING"
+    state._refresh_runtime_statuses(100.0)
+
+    # Not due yet
+    state._refresh_runtime_statuses(100.5)
+    assert service.polls == ["rt-1"]
+    # A tick landing slightly before the due time still polls
+    state._refresh_runtime_statuses(101.0 - TTL_TOLERANCE_SECONDS / 2)
+    assert service.polls == ["rt-1", "rt-1"]
+    assert state.runtime_cache["rt-1"]["last_refreshed"] == 101.0 - (
+        TTL_TOLERANCE_SECONDS / 2
+    )
+
+
+def test_ttl_per_status():
+    state, service, client = _state(interval=1)
+    _discovered(state, client, runtime_ids=("rt-q", "rt-d"))
+    service.statuses.update({"rt-q": "QUEUED", "rt-d": "DONE"})
+    state._refresh_runtime_statuses(100.0)
+
+    assert state.runtime_cache["rt-q"]["ttl"] == WAITING_STATUS_TTL_SECONDS
+    assert state.runtime_cache["rt-d"]["ttl"] == math.inf
+    assert state.runtime_cache["rt-d"]["terminal"]
+
+    state._refresh_runtime_statuses(100.0 + WAITING_STATUS_TTL_SECONDS)
+    # The terminal runtime is never polled again
+    assert sorted(service.polls) == ["rt-d", "rt-q", "rt-q"]
+
+
+def test_poll_error_keeps_backend_and_retries_after_interval():
+    state, service, client = _state(interval=2)
+    _discovered(state, client)
+    service.statuses["rt-1"] = "RUNNING"
+    state._refresh_runtime_statuses(100.0)
+
+    service.statuses["rt-1"] = RuntimeError("boom")
+    state._refresh_runtime_statuses(102.0)
+    runtime_data = state.runtime_cache["rt-1"]
+    assert runtime_data["status"] == "UNAVAILABLE: boom"
+    assert runtime_data["backend"] == "ibm_fake"
+    assert runtime_data["ttl"] == 2.0
+
+
+def test_request_status_refresh_expires_ttl():
+    state, service, client = _state()
+    _discovered(state, client)
+    service.statuses["rt-1"] = "DONE"
+    state._refresh_runtime_statuses(100.0)
+
+    state.request_status_refresh("job-1")
+    state._refresh_runtime_statuses(100.0)
+    assert service.polls == ["rt-1", "rt-1"]
+
+
+def test_attach_runtime_rows():
+    state, service, client = _state()
+    _discovered(state, client, runtime_ids=("rt-1", "rt-2"))
+    service.statuses.update({"rt-1": "RUNNING", "rt-2": "QUEUED"})
+    state._refresh_runtime_statuses(100.0)
+
+    rows = [{"job_id": "job-1"}, {"job_id": "job-2"}]
+    state.attach_runtime_rows(rows)
+    assert rows[0]["runtime_jobs"] == [
+        {"runtime_job_id": "rt-1", "backend": "ibm_fake", "status": "RUNNING"},
+        {"runtime_job_id": "rt-2", "backend": "ibm_fake", "status": "QUEUED"},
+    ]
+    assert rows[1]["runtime_jobs"] == []
+
+
+def test_frozen_terminal_jobs_are_not_polled_until_expanded():
+    state, service, client = _state()
+    state.freeze_terminal_jobs(["job-1"])
+    client.runtime_ids["job-1"] = ["rt-1"]
+    state.enqueue_runtime_discovery(["job-1"], is_terminal=True)
+    state._discover_batch()
+    service.statuses["rt-1"] = "DONE"
+
+    state._refresh_runtime_statuses(100.0)
+    assert service.polls == []
+
+    state.request_status_refresh("job-1")
+    state._refresh_runtime_statuses(100.0)
+    assert service.polls == ["rt-1"]
+
+
+def test_discovery_bumps_revision_only_for_new_runtime_ids():
+    state, _, client = _state()
+    assert state.get_runtime_count("job-1") is None
+
+    _discovered(state, client)
+    assert state.get_runtime_count("job-1") == 1
+    assert state.is_discovery_done("job-1")
+    assert state.revision == 1
+
+    # Rediscovery finding the same ids changes nothing
+    state._requeue_active_for_rediscovery()
+    state._discover_batch()
+    assert state.revision == 1
+
+    client.runtime_ids["job-1"].append("rt-2")
+    state._requeue_active_for_rediscovery()
+    state._discover_batch()
+    assert state.get_runtime_count("job-1") == 2
+    assert state.revision == 2
+
+
+def test_status_poll_bumps_revision_only_on_change():
+    state, service, client = _state()
+    _discovered(state, client)
+    service.statuses["rt-1"] = "RUNNING"
+
+    state._refresh_runtime_statuses(100.0)
+    assert state.runtime_cache["rt-1"]["status"] == "RUNNING"
+    assert state.runtime_cache["rt-1"]["backend"] == "ibm_fake"
+    revision = state.revision
+
+    state._refresh_runtime_statuses(101.0)
+    assert service.polls == ["rt-1", "rt-1"]
+    assert state.revision == revision
+
+    service.statuses["rt-1"] = "DONE"
+    state._refresh_runtime_statuses(102.0)
+    assert state.runtime_cache["rt-1"]["status"] == "DONE"
+    assert state.revision == revision + 1
+
+
+def test_worker_notifies_on_change():
+    changed = Event()
+    state, service, client = _state(on_change=changed.set)
+    client.runtime_ids["job-1"] = ["rt-1"]
+    service.statuses["rt-1"] = "RUNNING"
+    state.enqueue_runtime_discovery(["job-1"])
+    state.start()
+    try:
+        assert changed.wait(5)
+    finally:
+        state.stop()
+    assert state.get_runtime_count("job-1") == 1
+
+
+def test_forget_runtime_discovery_stops_rediscovery_and_keeps_cache():
+    state, _, client = _state()
+    _discovered(state, client)
+
+    state.forget_runtime_discovery(["job-1"])
+    client.runtime_ids["job-1"].append("rt-2")
+    state._requeue_active_for_rediscovery()
+    state._discover_batch()
+    assert state.get_runtime_count("job-1") == 1
+    assert "rt-1" in state.runtime_cache
+
+    # Listing the job again resumes rediscovery
+    state.enqueue_runtime_discovery(["job-1"])
+    state._requeue_active_for_rediscovery()
+    state._discover_batch()
+    assert state.get_runtime_count("job-1") == 2
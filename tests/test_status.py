@@ -0,0 +1,33 @@
+from qiskit_serverless_console.status import (
+    KNOWN_STATUSES,
+    TERMINAL_STATUSES,
+    is_terminal_status,
+)
+
+
+class _StrStatus(str):
+    """str subclass: must not take the exact-type fast path."""
+
+
+class _EnumLike:
+    def __str__(self) -> str:
+        return " done "
+
+
+def test_known_statuses_use_terminal_set():
+    for status in KNOWN_STATUSES:
+        assert is_terminal_status(status) is (status in TERMINAL_STATUSES)
+
+
+def test_non_canonical_strings_are_normalized():
+    assert is_terminal_status("done")
+    assert is_terminal_status("  Failed ")
+    assert not is_terminal_status("running")
+    assert not is_terminal_status("RUNNING: OPTIMIZING_HARDWARE")
+
+
+def test_other_values_fall_back_to_str():
+    assert is_terminal_status(_StrStatus("canceled"))
+    assert is_terminal_status(_EnumLike())
+    assert not is_terminal_status(None)
+    assert not is_terminal_status("")
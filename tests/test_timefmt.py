@@ -0,0 +1,47 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from qiskit_serverless_console.timefmt import created_timestamp, relative_created
+
+
+NOW = datetime(2026, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+
+def _ago(seconds: float) -> str:
+    return (NOW - timedelta(seconds=seconds)).isoformat()
+
+
+@pytest.mark.parametrize(
+    ("seconds", "expected"),
+    [
+        (0, "0s ago"),
+        (59, "59s ago"),
+        (60, "1 min ago"),
+        (3599, "59 min ago"),
+        (3600, "1 hours ago"),
+        (86399, "23 hours ago"),
+        (86400, "1 days ago"),
+        (-30, "0s ago"),  # clock skew: never in the future
+    ],
+)
+def test_relative_created_uses_given_now(seconds, expected):
+    assert relative_created(_ago(seconds), NOW) == expected
+
+
+def test_relative_created_accepts_z_and_naive_timestamps():
+    assert relative_created("2026-01-01T11:59:00Z", NOW) == "1 min ago"
+    assert relative_created("2026-01-01T11:59:00", NOW) == "1 min ago"
+
+
+def test_relative_created_missing_and_invalid():
+    assert relative_created(None, NOW) == "-"
+    assert relative_created("  ", NOW) == "-"
+    assert relative_created("not a date", NOW) == "not a date"
+
+
+def test_created_timestamp():
+    assert created_timestamp("2026-01-01T12:00:00Z") == NOW.timestamp()
+    assert created_timestamp("2026-01-01T12:00:00") == NOW.timestamp()
+    assert created_timestamp(None) == 0.0
+    assert created_timestamp("garbage") == 0.0
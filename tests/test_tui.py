@@ -0,0 +1,177 @@
+import asyncio
+import threading
+import time
+from datetime import datetime, timezone
+
+import pytest
+from textual.widgets import Static
+
+from qiskit_serverless_console import tui
+from qiskit_serverless_console.config import WatchOptions
+from qiskit_serverless_console.runtime import RuntimeState
+from qiskit_serverless_console.tui import JobsTreeApp, LogsScreen, StopConfirmScreen
+
+
+def _options() -> WatchOptions:
+    return WatchOptions(
+        job_id=None,
+        function=None,
+        status=None,
+        limit=10,
+        offset=0,
+        interval=1,
+        json_mode=False,
+        no_color=False,
+    )
+
+
+async def _wait_for(pilot, predicate, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("timed out waiting for the UI")
+        await pilot.pause(0.05)
+
+
+def test_runtime_changes_from_a_thread_coalesce_into_one_render():
+    app = JobsTreeApp(_options())
+    app._kick_fetch_if_due = lambda: None  # No clients in this test
+    renders: list[float] = []
+
+    def _deferred_render() -> None:
+        app._render_scheduled = False
+        renders.append(time.monotonic())
+
+    app._deferred_render = _deferred_render
+
+    async def _run() -> None:
+        async with app.run_test() as pilot:
+            worker = threading.Thread(
+                target=lambda: [app._on_runtime_change() for _ in range(5)]
+            )
+            worker.start()
+            # Posting never waits for the app loop
+            worker.join(timeout=1)
+            assert not worker.is_alive()
+            await _wait_for(pilot, lambda: bool(renders))
+            await pilot.pause(0.2)
+            assert len(renders) == 1
+
+    asyncio.run(_run())
+
+
+class _FakeJob:
+    def __init__(self, client: "_FakeServerlessClient") -> None:
+        self._client = client
+
+    def logs(self) -> str:
+        return self._client.logs
+
+    def stop(self) -> None:
+        self._client.stopped += 1
+
+
+class _FakeServerlessClient:
+    def __init__(self, logs: str) -> None:
+        self.logs = logs
+        self.stopped = 0
+
+    def job(self, job_id: str) -> _FakeJob:
+        return _FakeJob(self)
+
+    def runtime_jobs(self, job_id: str) -> list[str]:
+        return []
+
+
+class _FakeRuntimeService:
+    def job(self, runtime_id: str):
+        raise AssertionError("no runtime jobs in these tests")
+
+
+def _app(monkeypatch, logs: str) -> tuple[JobsTreeApp, _FakeServerlessClient]:
+    row = {
+        "job_id": "job-1",
+        "function": "my-function",
+        "status": "RUNNING",
+        "sub_status": None,
+        "created": datetime.now(timezone.utc).isoformat(),
+    }
+    monkeypatch.setattr(tui, "fetch_serverless_rows", lambda **_: [dict(row)])
+    client = _FakeServerlessClient(logs)
+    app = JobsTreeApp(_options())
+    # Skip build_clients(): the app only builds clients when these are unset
+    app._serverless_client = client
+    app._runtime_state = RuntimeState(_FakeRuntimeService(), client, interval=1)
+    app._runtime_state.start()
+    return app, client
+
+
+async def _select_first_job(app, pilot) -> None:
+    await _wait_for(pilot, lambda: "job-1" in app._job_nodes)
+    app._tree.move_cursor(app._job_nodes["job-1"])
+    await pilot.pause()
+
+
+def _text(widget: Static) -> str:
+    return str(widget.renderable)
+
+
+def test_logs_modal_reports_unrenderable_logs(monkeypatch):
+    app, _ = _app(monkeypatch, logs="[/bold] not valid markup")
+
+    async def _run() -> None:
+        async with app.run_test() as pilot:
+            await _select_first_job(app, pilot)
+            await pilot.press("l")
+            await _wait_for(pilot, lambda: isinstance(app.screen, LogsScreen))
+            screen = app.screen
+            await _wait_for(pilot, lambda: not screen._loading)
+            assert "Error showing logs" in _text(
+                screen.query_one("#logs-content", Static)
+            )
+            await pilot.press("escape")
+            await _wait_for(pilot, lambda: not app._modal_active)
+
+    asyncio.run(_run())
+
+
+def test_logs_modal_opens_and_closes(monkeypatch):
+    app, _ = _app(monkeypatch, logs="hello from the job")
+
+    async def _run() -> None:
+        async with app.run_test() as pilot:
+            await _select_first_job(app, pilot)
+            await pilot.press("l")
+            await _wait_for(pilot, lambda: isinstance(app.screen, LogsScreen))
+            screen = app.screen
+            await _wait_for(pilot, lambda: not screen._loading)
+            assert "hello from the job" in _text(
+                screen.query_one("#logs-content", Static)
+            )
+            await pilot.press("escape")
+            await _wait_for(pilot, lambda: not app._modal_active)
+
+    asyncio.run(_run())
+
+
+@pytest.mark.parametrize("confirm", [True, False])
+def test_stop_modal_opens_and_closes(monkeypatch, confirm):
+    app, client = _app(monkeypatch, logs="")
+
+    async def _run() -> None:
+        async with app.run_test() as pilot:
+            await _select_first_job(app, pilot)
+            await pilot.press("s")
+            await _wait_for(pilot, lambda: isinstance(app.screen, StopConfirmScreen))
+            screen = app.screen
+            if confirm:
+                await pilot.click("#ok-btn")
+                await _wait_for(pilot, lambda: bool(screen.query("#close-btn")))
+                assert "stopped" in _text(screen.query_one("#stop-message", Static))
+                await pilot.click("#close-btn")
+            else:
+                await pilot.press("escape")
+            await _wait_for(pilot, lambda: not app._modal_active)
+
+    asyncio.run(_run())
+    assert client.stopped == (1 if confirm else 0)
@@ -0,0 +1,250 @@
+import json
+import sys
+import time
+from concurrent.futures import Future
+from threading import Event, Timer
+
+import pytest
+
+from qiskit_serverless_console import watch
+from qiskit_serverless_console.config import WatchOptions, parse_options
+from qiskit_serverless_console.ndjson import dumps
+from qiskit_serverless_console.runtime import RuntimeState
+from qiskit_serverless_console.watch import (
+    _DEDUPE_HEARTBEAT_NS,
+    ADAPTIVE_BACKOFF_FACTOR,
+    STOP_CHECK_SECONDS,
+    _build_record,
+    _filter_rows,
+    _JsonWatch,
+    _next_poll_interval,
+    _sync_runtime_ids,
+    _wait_for_result,
+)
+
+
+def _options(**overrides) -> WatchOptions:
+    values = {
+        "job_id": None,
+        "function": None,
+        "status": None,
+        "limit": 10,
+        "offset": 0,
+        "interval": 2,
+        "json_mode": True,
+        "no_color": True,
+    }
+    values.update(overrides)
+    return WatchOptions(**values)
+
+
+def test_poll_interval_is_fixed_without_adaptive():
+    options = _options()
+    assert _next_poll_interval(2.0, changed=False, options=options) == 2.0
+    assert _next_poll_interval(2.0, changed=True, options=options) == 2.0
+
+
+def test_adaptive_poll_interval_backs_off_up_to_max():
+    options = _options(adaptive=True, max_interval=5)
+    interval = 2.0
+    seen = []
+    for _ in range(4):
+        interval = _next_poll_interval(interval, changed=False, options=options)
+        seen.append(interval)
+    assert ADAPTIVE_BACKOFF_FACTOR == 1.5
+    assert seen == [3.0, 4.5, 5.0, 5.0]
+
+
+def test_adaptive_poll_interval_resets_on_change():
+    options = _options(adaptive=True, max_interval=30)
+    assert _next_poll_interval(13.5, changed=True, options=options) == 2.0
+
+
+@pytest.mark.parametrize(
+    ("interval", "max_interval", "expected"), [(2, 30, 30), (10, 3, 10)]
+)
+def test_parse_options_keeps_max_interval_above_interval(
+    monkeypatch, interval, max_interval, expected
+):
+    monkeypatch.setenv("QISKIT_IBM_INSTANCE", "instance")
+    monkeypatch.setenv("QISKIT_IBM_TOKEN", "token")
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "qiskit-serverless-jobs-watch",
+            "--json",
+            "--adaptive",
+            "--interval",
+            str(interval),
+            "--max-interval",
+            str(max_interval),
+        ],
+    )
+    options = parse_options()
+    assert options.adaptive
+    assert options.max_interval == expected
+
+
+def test_wait_for_result_returns_done_future():
+    future: Future[int] = Future()
+    future.set_result(3)
+    assert _wait_for_result(future, None, Event()) == (True, 3)
+
+
+def test_wait_for_result_times_out():
+    assert _wait_for_result(Future(), 0.05, Event()) == (False, None)
+
+
+def test_wait_for_result_stops_on_stop_event():
+    stop_event = Event()
+    Timer(0.05, stop_event.set).start()
+    started = time.monotonic()
+    # No timeout: only the stop event can end the wait
+    assert _wait_for_result(Future(), None, stop_event) == (False, None)
+    assert time.monotonic() - started < 0.05 + STOP_CHECK_SECONDS * 2
+
+
+def test_filter_rows():
+    rows = [
+        {"job_id": "a", "function": "f", "status": "RUNNING"},
+        {"job_id": "b", "function": "f", "status": "DONE"},
+        {"job_id": "c", "function": "g", "status": "ERROR"},
+    ]
+    kept, statuses, terminal = _filter_rows(rows, None, "f")
+    assert kept == rows[:2]
+    assert statuses == {"a": "RUNNING", "b": "DONE"}
+    assert terminal == ["b"]
+
+    kept, _, terminal = _filter_rows(rows, "c", None)
+    assert kept == rows[2:]
+    assert terminal == ["c"]
+
+
+class _FakeWriter:
+    def __init__(self) -> None:
+        self.records: list[dict[str, object]] = []
+
+    def put(self, record: bytes) -> None:
+        self.records.append(json.loads(record))
+
+    def close(self) -> None:
+        pass
+
+
+class _FakeAttachingState:
+    """Stands in for RuntimeState in _JsonWatch._encode_rows."""
+
+    def __init__(self) -> None:
+        self.revision = 0
+        self.runtime_status = "QUEUED"
+
+    def attach_runtime_rows(self, rows: list[dict[str, object]]) -> None:
+        for row in rows:
+            row["runtime_jobs"] = [
+                {"runtime_job_id": "rt-1", "status": self.runtime_status}
+            ]
+
+
+def _json_watch(monkeypatch, **overrides) -> tuple[_JsonWatch, _FakeWriter]:
+    # No clients are needed: nothing here fetches
+    monkeypatch.setattr(watch, "build_clients", lambda: None)
+    json_watch = _JsonWatch(_options(**overrides), Event())
+    json_watch._writer.close()
+    writer = json_watch._writer = _FakeWriter()
+    return json_watch, writer
+
+
+def test_dedupe_suppresses_unchanged_snapshots_with_heartbeat(monkeypatch):
+    json_watch, writer = _json_watch(monkeypatch, dedupe=True)
+    runtime_state = _FakeAttachingState()
+    json_watch._runtime_state = runtime_state
+    json_watch._rows = [{"job_id": "job-1", "status": "RUNNING"}]
+    json_watch._encode_rows(fetched=True)
+
+    json_watch._emit(0)
+    assert writer.records[-1]["rows"][0]["runtime_jobs"][0]["status"] == "QUEUED"
+
+    # Unchanged: nothing until the heartbeat is due
+    json_watch._encode_rows(fetched=True)
+    json_watch._emit(_DEDUPE_HEARTBEAT_NS - 1)
+    assert len(writer.records) == 1
+    json_watch._emit(_DEDUPE_HEARTBEAT_NS)
+    assert len(writer.records) == 2
+    assert writer.records[-1]["unchanged"] is True
+    assert "rows" not in writer.records[-1]
+
+    # A runtime status change is emitted again right away
+    runtime_state.runtime_status = "RUNNING"
+    runtime_state.revision += 1
+    json_watch._encode_rows(fetched=False)
+    json_watch._emit(_DEDUPE_HEARTBEAT_NS + 1)
+    assert len(writer.records) == 3
+    assert writer.records[-1]["rows"][0]["runtime_jobs"][0]["status"] == "RUNNING"
+
+
+def test_without_dedupe_every_snapshot_is_emitted(monkeypatch):
+    json_watch, writer = _json_watch(monkeypatch)
+    json_watch._rows = [{"job_id": "job-1", "status": "RUNNING"}]
+    json_watch._encode_rows(fetched=True)
+    json_watch._emit(0)
+    json_watch._emit(1)
+    assert [len(record["rows"]) for record in writer.records] == [1, 1]
+
+
+class _RecordingState:
+    def __init__(self) -> None:
+        self.enqueued: list[list[str]] = []
+        self.forgotten: list[list[str]] = []
+
+    def enqueue_runtime_discovery(self, serverless_job_ids: list[str]) -> None:
+        self.enqueued.append(serverless_job_ids)
+
+    def forget_runtime_discovery(self, serverless_job_ids: list[str]) -> None:
+        self.forgotten.append(serverless_job_ids)
+
+
+def test_sync_runtime_ids_sends_only_the_delta():
+    state = _RecordingState()
+    previous = dict.fromkeys(["a", "b", "c"]).keys()
+    current = dict.fromkeys(["b", "c", "d", "e"]).keys()
+    _sync_runtime_ids(state, previous, current)
+    assert state.enqueued == [["d", "e"]]
+    assert state.forgotten == [["a"]]
+
+    state = _RecordingState()
+    _sync_runtime_ids(state, current, dict.fromkeys(current).keys())
+    assert state.enqueued == []
+    assert state.forgotten == []
+
+
+class _NoRuntimeJobsClient:
+    def runtime_jobs(self, job_id: str) -> list[str]:
+        return []
+
+
+def test_sync_runtime_ids_re_enables_a_job_listed_again():
+    state = RuntimeState(None, _NoRuntimeJobsClient(), interval=1)
+    both = dict.fromkeys(["a", "b"]).keys()
+    only_b = dict.fromkeys(["b"]).keys()
+
+    _sync_runtime_ids(state, {}.keys(), both)
+    assert state._active_serverless_jobs == {"a", "b"}
+    _sync_runtime_ids(state, both, only_b)
+    assert state._active_serverless_jobs == {"b"}
+    _sync_runtime_ids(state, only_b, both)
+    assert state._active_serverless_jobs == {"a", "b"}
+
+
+def test_build_record_matches_full_encoding():
+    rows = [{"job_id": "job-1", "status": "RUNNING"}]
+    record = _build_record("2026-01-01T00:00:00+00:00", dumps(rows))
+    assert record == dumps({"refreshed_at": "2026-01-01T00:00:00+00:00", "rows": rows})
+
+
+def test_build_record_heartbeat():
+    record = _build_record("2026-01-01T00:00:00+00:00", None)
+    assert json.loads(record) == {
+        "refreshed_at": "2026-01-01T00:00:00+00:00",
+        "unchanged": True,
+    }